@@ -0,0 +1,14 @@
+import pytest
+
+from vero.core.chat_openai import _CLIENT_CACHE
+
+
+@pytest.fixture(autouse=True)
+def _clear_openai_client_cache():
+    """
+    OpenAI clients are shared per endpoint; reset them so each test sees
+    its own patched client.
+    """
+    _CLIENT_CACHE.clear()
+    yield
+    _CLIENT_CACHE.clear()
@@ -1,5 +1,8 @@
+import json
+import asyncio
 import pytest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, AsyncMock, patch
 from vero.core import Message, ChatOpenAI, LLMConfigError, LLMCallError
 
 
@@ -38,7 +41,7 @@ def test_generate_returns_message(mock_openai_class):
     mock_response.usage.completion_tokens = 5
     mock_response.usage.total_tokens = 15
 
-    mock_client.chat.completions.create.return_value = mock_response
+    mock_client.post.return_value = mock_response
 
     chat = ChatOpenAI(api_key="dummy", base_url="https://dummy", model_name="test-model")
     messages = [Message.user("Hi")]
@@ -63,7 +66,7 @@ def test_generate_stream_yields_chunks(mock_openai_class):
     mock_chunk = MagicMock()
     mock_chunk.choices[0].delta.content = "Hello"
 
-    mock_client.chat.completions.create.return_value = iter([mock_chunk])
+    mock_client.post.return_value = iter([mock_chunk])
 
     chat = ChatOpenAI(api_key="dummy", base_url="https://dummy", model_name="test-model")
     messages = [Message.user("Hi")]
@@ -81,7 +84,7 @@ def test_generate_raises_llm_call_error_non_stream(mock_openai_class):
     """
     mock_client = MagicMock()
     mock_openai_class.return_value = mock_client
-    mock_client.chat.completions.create.side_effect = Exception("API failure")
+    mock_client.post.side_effect = Exception("API failure")
 
     chat = ChatOpenAI(api_key="dummy", base_url="https://dummy", model_name="test-model")
     messages = [Message.user("Hi")]
@@ -97,10 +100,245 @@ def test_generate_raises_llm_call_error_stream(mock_openai_class):
     """
     mock_client = MagicMock()
     mock_openai_class.return_value = mock_client
-    mock_client.chat.completions.create.side_effect = Exception("API failure")
+    mock_client.post.side_effect = Exception("API failure")
 
     chat = ChatOpenAI(api_key="dummy", base_url="https://dummy", model_name="test-model")
     messages = [Message.user("Hi")]
 
     with pytest.raises(LLMCallError):
         list(chat.generate(messages, stream=True))
+
+
+def _chunk(content=None, tool_calls=None, usage=None, choices=True):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(delta=delta)] if choices else [],
+        usage=usage,
+    )
+
+
+def _tool_delta(index, id=None, name=None, arguments=None):
+    return SimpleNamespace(
+        index=index,
+        id=id,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+@patch("vero.core.chat_openai.OpenAI")
+def test_generate_stream_assembles_result(mock_openai_class):
+    """
+    Test that the streaming response exposes the assembled Message (content,
+    merged tool calls and usage) once iteration is complete.
+    """
+    mock_client = MagicMock()
+    mock_openai_class.return_value = mock_client
+
+    mock_client.post.return_value = iter([
+        _chunk(content="Let me "),
+        _chunk(content="check."),
+        _chunk(tool_calls=[_tool_delta(0, id="call_1", name="search", arguments='{"qu')]),
+        _chunk(tool_calls=[_tool_delta(0, arguments='ery": "x"}')]),
+        _chunk(
+            choices=False,
+            usage=SimpleNamespace(prompt_tokens=3, completion_tokens=4, total_tokens=7),
+        ),
+    ])
+
+    chat = ChatOpenAI(api_key="dummy", base_url="https://dummy", model_name="test-model")
+    response = chat.generate([Message.user("Hi")], stream=True)
+
+    assert response.result is None
+    assert "".join(response) == "Let me check."
+
+    result = response.result
+    assert isinstance(result, Message)
+    assert result.content == "Let me check."
+    assert result.tool_calls == [
+        {
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": "search", "arguments": '{"query": "x"}'},
+        }
+    ]
+    assert result.metadata["usage"]["total_tokens"] == 7
+
+
+@patch("vero.core.chat_openai.OpenAI")
+def test_generate_batch_file_and_poll(mock_openai_class):
+    """
+    Test that batch requests are uploaded as JSONL and results are returned
+    in request order once the batch completes.
+    """
+    mock_client = MagicMock()
+    mock_openai_class.return_value = mock_client
+    mock_client.files.create.return_value.id = "file-1"
+    mock_client.batches.create.return_value.id = "batch-1"
+
+    chat = ChatOpenAI(api_key="dummy", base_url="https://dummy", model_name="test-model")
+    batch_id = chat.generate_batch_file([[Message.user("a")], [Message.user("b")]])
+
+    assert batch_id == "batch-1"
+    _, payload = mock_client.files.create.call_args.kwargs["file"]
+    lines = [json.loads(l) for l in payload.decode().splitlines()]
+    assert [l["custom_id"] for l in lines] == ["request-0", "request-1"]
+    assert lines[1]["body"]["messages"] == [{"role": "user", "content": "b"}]
+
+    # Still running
+    mock_client.batches.retrieve.return_value.status = "in_progress"
+    assert chat.poll_batch(batch_id) is None
+
+    # Completed (output lines may come back out of order)
+    def _record(i, content):
+        return json.dumps({
+            "custom_id": f"request-{i}",
+            "response": {
+                "status_code": 200,
+                "body": {"choices": [{"message": {"role": "assistant", "content": content}}]},
+            },
+        })
+
+    mock_client.batches.retrieve.return_value.status = "completed"
+    mock_client.batches.retrieve.return_value.request_counts.total = 2
+    mock_client.files.content.return_value.text = "\n".join([_record(1, "B"), _record(0, "A")])
+
+    results = chat.poll_batch(batch_id)
+    assert [m.content for m in results] == ["A", "B"]
+
+
+@patch("vero.core.chat_openai.OpenAI")
+def test_poll_batch_raises_on_failed_batch(mock_openai_class):
+    mock_client = MagicMock()
+    mock_openai_class.return_value = mock_client
+    mock_client.batches.retrieve.return_value.status = "failed"
+
+    chat = ChatOpenAI(api_key="dummy", base_url="https://dummy", model_name="test-model")
+
+    with pytest.raises(LLMCallError):
+        chat.poll_batch("batch-1")
+
+
+@patch("vero.core.chat_openai.AsyncOpenAI")
+@patch("vero.core.chat_openai.OpenAI")
+def test_agenerate_returns_message(mock_openai_class, mock_async_openai_class):
+    """
+    Test that agenerate() awaits the async client and returns a Message.
+    """
+    mock_async_client = MagicMock()
+    mock_async_openai_class.return_value = mock_async_client
+
+    mock_choice = MagicMock()
+    mock_choice.message.content = "Hello, async!"
+    mock_choice.message.tool_calls = None
+    mock_response = MagicMock()
+    mock_response.choices = [mock_choice]
+    mock_async_client.post = AsyncMock(return_value=mock_response)
+
+    chat = ChatOpenAI(api_key="dummy", base_url="https://dummy", model_name="test-model")
+    result = asyncio.run(chat.agenerate([Message.user("Hi")]))
+
+    assert isinstance(result, Message)
+    assert result.content == "Hello, async!"
+    mock_async_openai_class.assert_called_once()
+
+
+@patch("vero.core.chat_openai.OpenAI")
+def test_generate_stream_coalesces_small_chunks(mock_openai_class):
+    """
+    Test that a burst of small deltas is coalesced by the stream buffer, and
+    passed through unchanged when buffering is disabled.
+    """
+    mock_client = MagicMock()
+    mock_openai_class.return_value = mock_client
+    deltas = ["a", "b", "c", "d"]
+
+    mock_client.post.return_value = iter([_chunk(content=d) for d in deltas])
+    chat = ChatOpenAI(api_key="dummy", base_url="https://dummy", model_name="test-model")
+    assert list(chat.generate([Message.user("Hi")], stream=True)) == ["abcd"]
+
+    mock_client.post.return_value = iter([_chunk(content=d) for d in deltas])
+    chat = ChatOpenAI(
+        api_key="dummy", base_url="https://dummy", model_name="test-model", stream_buffer=False
+    )
+    assert list(chat.generate([Message.user("Hi")], stream=True)) == deltas
+
+
+@patch("vero.core.chat_openai.OpenAI")
+def test_clients_are_shared_per_endpoint(mock_openai_class):
+    """
+    Test that ChatOpenAI instances pointing at the same endpoint share one
+    OpenAI client (and its connection pool).
+    """
+    mock_openai_class.side_effect = lambda **kw: MagicMock()
+
+    a = ChatOpenAI(api_key="dummy", base_url="https://dummy", model_name="m1")
+    b = ChatOpenAI(api_key="dummy", base_url="https://dummy", model_name="m2")
+    c = ChatOpenAI(api_key="other", base_url="https://dummy", model_name="m1")
+
+    assert a._client is b._client
+    assert a._client is not c._client
+    assert mock_openai_class.call_count == 2
+
+
+def test_split_request_builds_post_body_and_options():
+    """
+    Requests are posted with a plain JSON body: unset fields are dropped,
+    extra_body is merged and SDK-only arguments become request options.
+    """
+    payload = {
+        "model": "m",
+        "messages": [{"role": "user", "content": "Hi"}],
+        "max_tokens": None,
+        "extra_body": {"top_k": 5},
+        "extra_headers": {"X-Trace": "1"},
+    }
+
+    body, options = ChatOpenAI._split_request(payload, stream=True)
+
+    assert body == {
+        "model": "m",
+        "messages": [{"role": "user", "content": "Hi"}],
+        "top_k": 5,
+        "stream": True,
+    }
+    assert options == {"headers": {"X-Trace": "1"}}
+
+
+def test_prompt_cache_marks_system_message():
+    """
+    With enable_prompt_cache, the system message carries a cache_control
+    breakpoint and the request a prompt_cache_key tied to the system prompt.
+    """
+    chat = ChatOpenAI(
+        api_key="dummy", base_url="https://dummy", model_name="test-model",
+        enable_prompt_cache=True,
+    )
+    messages = [Message.system("You are helpful."), Message.user("Hi")]
+
+    payload = chat._build_payload(messages, None, None, None, {})
+    other = chat._build_payload([Message.system("Other.")], None, None, None, {})
+
+    assert payload["messages"][0]["content"] == [
+        {"type": "text", "text": "You are helpful.", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert payload["messages"][1] == {"role": "user", "content": "Hi"}
+    assert payload["prompt_cache_key"] == chat._build_payload(messages, None, None, None, {})["prompt_cache_key"]
+    assert payload["prompt_cache_key"] != other["prompt_cache_key"]
+
+
+def test_zero_temperature_override_is_kept():
+    chat = ChatOpenAI(
+        api_key="dummy", base_url="https://dummy", model_name="test-model",
+        temperature=0.7,
+    )
+
+    assert chat._build_payload([], 0, None, None, {})["temperature"] == 0
+    assert chat._build_payload([], None, None, None, {})["temperature"] == 0.7
+
+
+def test_to_message_dicts_handles_homogeneous_and_mixed_lists():
+    dicts = [{"role": "user", "content": "Hi"}]
+
+    assert ChatOpenAI._to_message_dicts(dicts) is dicts
+    assert ChatOpenAI._to_message_dicts([Message.user("Hi")]) == dicts
+    assert ChatOpenAI._to_message_dicts([Message.user("Hi"), dicts[0]]) == dicts * 2
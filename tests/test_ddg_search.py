@@ -0,0 +1,67 @@
+import asyncio
+import threading
+from unittest.mock import patch, MagicMock
+
+from vero.tool.buildin import ddg_search
+from vero.tool.buildin.ddg_search import duckduckgo_search, duckduckgo_search_async
+
+
+def _mock_ddgs(results):
+    ddgs = MagicMock()
+    ddgs.__enter__.return_value.text.return_value = results
+    return ddgs
+
+
+@patch("vero.tool.buildin.ddg_search.DDGS")
+def test_repeated_query_is_served_from_cache(mock_ddgs_cls):
+    ddg_search._search_cache.clear()
+    mock_ddgs_cls.return_value = _mock_ddgs(
+        [{"title": "Vero", "href": "https://example.com", "body": "agents"}]
+    )
+
+    first = duckduckgo_search("vero agents")
+    second = duckduckgo_search("vero agents")
+
+    assert first == second
+    assert "Link: https://example.com" in first
+    assert mock_ddgs_cls.call_count == 1
+
+    duckduckgo_search("vero agents", max_results=5)
+    assert mock_ddgs_cls.call_count == 2
+
+
+@patch("vero.tool.buildin.ddg_search.DDGS")
+def test_empty_and_failed_searches_are_not_cached(mock_ddgs_cls):
+    ddg_search._search_cache.clear()
+    mock_ddgs_cls.return_value = _mock_ddgs([])
+
+    assert duckduckgo_search("nothing") == "No search results found."
+    assert duckduckgo_search("nothing") == "No search results found."
+    assert mock_ddgs_cls.call_count == 2
+
+    mock_ddgs_cls.side_effect = RuntimeError("offline")
+    assert duckduckgo_search("down").startswith("DuckDuckGo search failed")
+    assert len(ddg_search._search_cache) == 0
+
+
+@patch("vero.tool.buildin.ddg_search.DDGS")
+def test_async_search_runs_concurrently(mock_ddgs_cls):
+    ddg_search._search_cache.clear()
+    # Only released once all three searches are in flight at the same time
+    barrier = threading.Barrier(3, timeout=5)
+
+    def blocking_text(query, max_results):
+        barrier.wait()
+        return [{"title": query, "href": "", "body": ""}]
+
+    mock_ddgs_cls.return_value.__enter__.return_value.text.side_effect = blocking_text
+
+    async def search_all():
+        return await asyncio.gather(
+            *(duckduckgo_search_async(q) for q in ("a", "b", "c"))
+        )
+
+    outputs = asyncio.run(search_all())
+
+    assert duckduckgo_search_async.is_async
+    assert [o.splitlines()[0] for o in outputs] == ["Title: a", "Title: b", "Title: c"]
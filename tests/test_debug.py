@@ -0,0 +1,33 @@
+import logging
+
+from vero.config import settings
+from vero.core import log_debug
+
+
+def test_log_debug_respects_settings(monkeypatch, caplog):
+    monkeypatch.setattr(settings, "debug", False)
+    log_debug("hidden")
+    assert caplog.messages == []
+
+    monkeypatch.setattr(settings, "debug", True)
+    log_debug("shown")
+    assert caplog.messages == ["shown"]
+    assert caplog.records[0].name == "vero"
+
+
+def test_debug_setting_controls_agent_logger(monkeypatch, caplog):
+    """
+    `settings.debug` is the single switch for `log_debug` and the module
+    loggers under "vero" (e.g. OpenAIFunctionAgent's "vero.agent").
+    """
+    agent_logger = logging.getLogger("vero.agent")
+
+    monkeypatch.setattr(settings, "debug", False)
+    log_debug("sync")
+    agent_logger.debug("hidden")
+    assert "hidden" not in caplog.messages
+
+    monkeypatch.setattr(settings, "debug", True)
+    log_debug("sync")
+    agent_logger.debug("shown")
+    assert "shown" in caplog.messages
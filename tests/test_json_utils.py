@@ -0,0 +1,32 @@
+import pytest
+
+from vero.core import json_utils
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """
+    Run each test against orjson (when installed) and the stdlib fallback.
+    """
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_utils, "orjson", None)
+    elif json_utils.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_roundtrip(backend):
+    obj = {"b": [1, 2.5, None], "a": "héllo"}
+
+    assert json_utils.loads(json_utils.dumps(obj)) == obj
+    assert json_utils.loads(json_utils.dumps_bytes(obj)) == obj
+
+
+def test_sort_keys_is_canonical(backend):
+    assert json_utils.dumps_bytes({"b": 1, "a": 2}, sort_keys=True) == \
+        json_utils.dumps_bytes({"a": 2, "b": 1}, sort_keys=True)
+
+
+def test_invalid_json_raises_json_decode_error(backend):
+    with pytest.raises(json_utils.JSONDecodeError):
+        json_utils.loads("{not json")
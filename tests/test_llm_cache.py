@@ -0,0 +1,102 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from vero.core import Message, ChatOpenAI, LLMCache, MemoryBackend
+
+
+def _mock_response(content: str) -> MagicMock:
+    mock_choice = MagicMock()
+    mock_choice.message.content = content
+    mock_choice.message.tool_calls = None
+
+    mock_response = MagicMock()
+    mock_response.choices = [mock_choice]
+    mock_response.usage.prompt_tokens = 10
+    mock_response.usage.completion_tokens = 5
+    mock_response.usage.total_tokens = 15
+    return mock_response
+
+
+def test_memory_backend_lru_eviction():
+    backend = MemoryBackend(maxsize=2)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    backend.get("a")  # "a" becomes most recently used
+    backend.set("c", 3)
+
+    assert backend.get("a") == 1
+    assert backend.get("b") is None
+    assert backend.get("c") == 3
+
+
+def test_memory_backend_expiry():
+    backend = MemoryBackend()
+    backend.set("a", 1, expire=0.05)
+
+    assert backend.get("a") == 1
+    time.sleep(0.1)
+    assert backend.get("a") is None
+
+
+def test_cache_key_is_order_independent():
+    k1 = LLMCache.cache_key({"model": "m", "temperature": 0})
+    k2 = LLMCache.cache_key({"temperature": 0, "model": "m"})
+
+    assert k1 == k2
+    assert k1 != LLMCache.cache_key({"model": "m", "temperature": 0.5})
+
+
+@patch("vero.core.chat_openai.OpenAI")
+def test_generate_uses_cache_for_deterministic_calls(mock_openai_class):
+    mock_client = MagicMock()
+    mock_openai_class.return_value = mock_client
+    mock_client.post.return_value = _mock_response("cached!")
+
+    cache = LLMCache()
+    chat = ChatOpenAI(
+        api_key="dummy", base_url="https://dummy", model_name="test-model",
+        temperature=0, cache=cache,
+    )
+    messages = [Message.user("Hi")]
+
+    first = chat.generate(messages)
+    second = chat.generate(messages)
+
+    assert mock_client.post.call_count == 1
+    assert second.content == first.content == "cached!"
+    assert second.metadata["cache_hit"] is True
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+
+@patch("vero.core.chat_openai.OpenAI")
+def test_generate_skips_cache_when_sampling(mock_openai_class):
+    mock_client = MagicMock()
+    mock_openai_class.return_value = mock_client
+    mock_client.post.return_value = _mock_response("hello")
+
+    cache = LLMCache()
+    chat = ChatOpenAI(
+        api_key="dummy", base_url="https://dummy", model_name="test-model",
+        temperature=0.7, cache=cache,
+    )
+    messages = [Message.user("Hi")]
+
+    chat.generate(messages)
+    chat.generate(messages)
+
+    assert mock_client.post.call_count == 2
+    assert cache.stats == {"hits": 0, "misses": 0}
+
+
+def test_stats_are_exact_under_concurrent_lookups():
+    cache = LLMCache()
+    cache.set("hit", "value")
+
+    def lookup(i):
+        cache.get("hit" if i % 2 else "miss")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lookup, range(4000)))
+
+    assert cache.stats == {"hits": 2000, "misses": 2000}
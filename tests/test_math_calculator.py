@@ -0,0 +1,40 @@
+import math
+
+from vero.tool.buildin.math_calculator import _compile_expr, math_evaluate
+
+
+def test_math_evaluate_uses_math_names():
+    assert math_evaluate("sqrt(16) + pi * 0") == "4.0"
+
+
+def test_math_evaluate_rejects_other_names():
+    assert math_evaluate("__import__('os')") == "Error: use of '__import__' is not allowed."
+    assert math_evaluate("1 +").startswith("Evaluation error")
+
+
+def test_repeated_expression_is_compiled_once():
+    _compile_expr.cache_clear()
+
+    for _ in range(3):
+        assert math_evaluate("2 ** 10") == "1024"
+
+    info = _compile_expr.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_attribute_access_is_checked():
+    assert math_evaluate("(1).__class__") == "Error: use of '__class__' is not allowed."
+    assert math_evaluate("floor(2.5) + e ** 0") == "3.0"
+
+
+def test_only_whitelisted_math_names_are_allowed():
+    assert math_evaluate("factorial(100000)") == "Error: use of 'factorial' is not allowed."
+    assert math_evaluate("atan2(0, 1) + log10(100)") == "2.0"
+
+
+def test_assignment_is_rejected_and_names_stay_intact():
+    assert math_evaluate("(pi := 3)") == "Error: assignment to 'pi' is not allowed."
+    assert math_evaluate("[sqrt for sqrt in (1, 2)]").startswith("Error: assignment")
+
+    assert math_evaluate("pi") == str(math.pi)
+    assert math_evaluate("sqrt(4)") == "2.0"
@@ -1,4 +1,9 @@
 import time
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
 from vero.core import Message
 
 
@@ -75,3 +80,43 @@ def test_timestamp_auto_generated():
 
     assert t0 <= msg1.timestamp <= t1
     assert msg1.timestamp <= msg2.timestamp <= t1
+
+
+def test_datetime_timestamp():
+    msg = Message.user("a")
+
+    assert msg.datetime_timestamp == datetime.fromtimestamp(msg.timestamp)
+    assert "timestamp" not in msg.to_dict()
+
+
+def test_to_dict_is_cached_until_field_assignment():
+    msg = Message.system("v1")
+    first = msg.to_dict()
+
+    assert msg.to_dict() is first
+    assert msg == Message.system("v1", timestamp=msg.timestamp)  # cache not compared
+
+    msg.content = "v2"
+    assert msg.to_dict() == {"role": "system", "content": "v2"}
+    assert first == {"role": "system", "content": "v1"}
+
+
+def test_validated_constructors_check_input():
+    """
+    Internal constructors skip validation; the validated_* variants do not.
+    """
+    checked = Message.validated_user("hi")
+    assert checked == Message.user("hi", timestamp=checked.timestamp)
+
+    with pytest.raises(ValidationError):
+        Message.validated_assistant(content=123)
+
+    msg = Message.tool("42", tool_call_id="call_0")
+    assert msg.to_dict() == {"content": "42", "role": "tool", "tool_call_id": "call_0"}
+
+
+def test_unknown_role_is_rejected_on_validation():
+    with pytest.raises(ValidationError):
+        Message(role="robot", content="hi")
+
+    assert Message.model_validate({"role": "tool", "content": "x"}).role == "tool"
@@ -0,0 +1,351 @@
+import json
+import time
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, AsyncMock, patch
+
+import pytest
+
+from vero.core import Message, ChatOpenAI
+from vero.agents import OpenAIFunctionAgent
+from vero.tool import tool, ToolResult
+
+
+@tool
+def slow_echo(text: str, delay: float = 0.2) -> str:
+    """Echo the text back after sleeping for `delay` seconds."""
+    time.sleep(delay)
+    return text
+
+
+@tool
+async def async_echo(text: str, delay: float = 0.2) -> str:
+    """Echo the text back after awaiting for `delay` seconds."""
+    await asyncio.sleep(delay)
+    return text
+
+
+@tool
+def broken(x: int) -> int:
+    """Always fails."""
+    raise RuntimeError("boom")
+
+
+@tool
+def answer_now(text: str) -> ToolResult:
+    """Return the text as the final answer."""
+    return ToolResult(content=text, final=True)
+
+
+def _rendezvous_tool(parties: int):
+    """
+    Build a tool that only returns once `parties` calls are in flight at the
+    same time; run sequentially, the first call times out and fails.
+    """
+    barrier = threading.Barrier(parties, timeout=5)
+
+    @tool
+    def rendezvous(text: str) -> str:
+        """Return the text once all concurrent calls have arrived."""
+        barrier.wait()
+        return text
+
+    return rendezvous
+
+
+def _tool_call(call_id: str, name: str, args: dict) -> dict:
+    return {
+        "id": call_id,
+        "type": "function",
+        "function": {"name": name, "arguments": json.dumps(args)},
+    }
+
+
+def _make_agent(replies, tools=None, **kwargs):
+    llm = MagicMock()
+    llm.generate.side_effect = replies
+    agent = OpenAIFunctionAgent(
+        "test-agent", llm, tools=tools or [slow_echo, broken], **kwargs
+    )
+    return agent, llm
+
+
+def test_run_returns_text_without_tool_calls():
+    agent, llm = _make_agent([Message.assistant("done")])
+
+    assert agent.run("hi") == "done"
+    assert llm.generate.call_count == 1
+
+
+def test_parallel_tool_calls_preserve_order():
+    """
+    Tool calls in one turn run concurrently, but results are injected in the
+    same order as the model's `tool_calls`.
+    """
+    calls = [
+        _tool_call("call_0", "rendezvous", {"text": "first"}),
+        _tool_call("call_1", "rendezvous", {"text": "second"}),
+        _tool_call("call_2", "rendezvous", {"text": "third"}),
+    ]
+    agent, _ = _make_agent(
+        [Message.assistant(tool_calls=calls), Message.assistant("final")],
+        tools=[_rendezvous_tool(3)],
+    )
+
+    answer = agent.run("echo three times")
+
+    assert answer == "final"
+
+    tool_msgs = [m for m in agent._history if m.role == "tool"]
+    assert [m.tool_call_id for m in tool_msgs] == ["call_0", "call_1", "call_2"]
+    assert [m.content for m in tool_msgs] == ["first", "second", "third"]
+
+
+def test_failing_tool_does_not_poison_batch():
+    calls = [
+        _tool_call("call_0", "broken", {"x": 1}),
+        _tool_call("call_1", "slow_echo", {"text": "ok", "delay": 0}),
+    ]
+    agent, _ = _make_agent(
+        [Message.assistant(tool_calls=calls), Message.assistant("final")]
+    )
+
+    agent.run("go")
+
+    tool_msgs = [m for m in agent._history if m.role == "tool"]
+    assert tool_msgs[0].content.startswith("Tool execution failed")
+    assert tool_msgs[1].content == "ok"
+
+
+def test_history_is_sent_pre_serialized():
+    """
+    The agent sends its wire-format history, serialized once per message.
+    """
+    agent, llm = _make_agent([Message.assistant("done")])
+
+    agent.run("hi")
+
+    sent = llm.generate.call_args.kwargs["messages"]
+    assert all(isinstance(m, dict) for m in sent)
+    assert {"role": "user", "content": "hi"} in sent
+
+
+def test_static_prefix_is_stable_across_turns():
+    """
+    Every request starts with the same system message object, followed by the
+    dynamic part of the conversation.
+    """
+    calls = [_tool_call("call_0", "slow_echo", {"text": "x", "delay": 0})]
+    agent, llm = _make_agent(
+        [Message.assistant(tool_calls=calls), Message.assistant("final")]
+    )
+
+    agent.run("go")
+
+    first, second = (c.kwargs["messages"] for c in llm.generate.call_args_list)
+    assert first[0] is second[0]
+    assert first[0]["role"] == "system"
+    assert all(m["role"] != "system" for m in agent._serialized_history)
+
+
+def test_prompt_cache_marks_system_prefix():
+    agent, llm = _make_agent([Message.assistant("done")], enable_prompt_cache=True)
+
+    agent.run("hi")
+
+    system = llm.generate.call_args.kwargs["messages"][0]
+    assert system["content"][-1]["cache_control"] == {"type": "ephemeral"}
+
+
+def test_run_batch_returns_answers_in_order():
+    """
+    Each query runs on its own fork; answers come back in query order and the
+    original agent's history is left untouched.
+    """
+    llm = MagicMock()
+    llm.generate.side_effect = lambda messages, **kw: Message.assistant(
+        f"answer to {messages[-1]['content']}"
+    )
+    agent = OpenAIFunctionAgent("test-agent", llm, tools=[slow_echo])
+
+    answers = agent.run_batch(["a", "b", "c"], max_concurrency=2)
+
+    assert answers == ["answer to a", "answer to b", "answer to c"]
+    assert agent._history == []
+
+
+def test_run_batch_async_returns_answers_in_order():
+    llm = MagicMock()
+    llm.agenerate = AsyncMock(side_effect=lambda messages, **kw: Message.assistant(
+        f"answer to {messages[-1]['content']}"
+    ))
+    agent = OpenAIFunctionAgent("test-agent", llm, tools=[slow_echo])
+
+    answers = asyncio.run(agent.run_batch_async(["a", "b"]))
+
+    assert answers == ["answer to a", "answer to b"]
+
+
+def test_arun_gathers_sync_and_async_tools():
+    """
+    The sync tool (on the tool pool) and the async tool (on the event loop)
+    must be in flight together to pass the barrier.
+    """
+    barrier = threading.Barrier(2, timeout=5)
+
+    @tool
+    def sync_meet(text: str) -> str:
+        """Return the text once the async tool has arrived."""
+        barrier.wait()
+        return text
+
+    @tool
+    async def async_meet(text: str) -> str:
+        """Return the text once the sync tool has arrived."""
+        await asyncio.to_thread(barrier.wait)
+        return text
+
+    calls = [
+        _tool_call("call_0", "sync_meet", {"text": "sync"}),
+        _tool_call("call_1", "async_meet", {"text": "async"}),
+        _tool_call("call_2", "broken", {"x": 1}),
+    ]
+    llm = MagicMock()
+    llm.agenerate = AsyncMock(
+        side_effect=[Message.assistant(tool_calls=calls), Message.assistant("final")]
+    )
+    agent = OpenAIFunctionAgent(
+        "test-agent", llm, tools=[sync_meet, async_meet, broken]
+    )
+
+    answer = asyncio.run(agent.arun("go"))
+
+    assert answer == "final"
+
+    tool_msgs = [m for m in agent._history if m.role == "tool"]
+    assert [m.content for m in tool_msgs[:2]] == ["sync", "async"]
+    assert tool_msgs[2].content.startswith("Tool execution failed")
+
+
+def test_run_executes_async_tool():
+    calls = [_tool_call("call_0", "async_echo", {"text": "hi", "delay": 0})]
+    agent, _ = _make_agent(
+        [Message.assistant(tool_calls=calls), Message.assistant("final")],
+        tools=[async_echo],
+    )
+
+    agent.run("go")
+
+    assert agent._history[-2].content == "hi"
+
+
+def test_final_tool_result_skips_next_llm_turn():
+    calls = [_tool_call("call_0", "answer_now", {"text": "42"})]
+    agent, llm = _make_agent(
+        [Message.assistant(tool_calls=calls)], tools=[answer_now]
+    )
+
+    assert agent.run("what is the answer?") == "42"
+    assert llm.generate.call_count == 1
+    assert [m.role for m in agent._history] == ["user", "assistant", "tool", "assistant"]
+    assert agent._history[-2].content == "42"
+
+
+def test_toolless_agent_omits_tool_arguments():
+    """
+    tool_choice is only valid together with tools, so neither is sent when the
+    agent has no tools.
+    """
+    llm = MagicMock()
+    llm.generate.return_value = Message.assistant("done")
+    agent = OpenAIFunctionAgent("test-agent", llm)
+
+    agent.run("hi")
+
+    kwargs = llm.generate.call_args.kwargs
+    assert "tools" not in kwargs
+    assert "tool_choice" not in kwargs
+
+
+def test_parse_tool_arguments():
+    parse = OpenAIFunctionAgent._parse_tool_arguments
+
+    assert parse('{"a": 1}') == {"a": 1}
+    assert parse("  ") == {}
+    assert parse(None) == {}
+    assert parse("[1, 2]") == {}
+    assert parse("not json") == {}
+    assert parse('{"a": ') == {}
+
+
+def test_final_message_is_serialized_lazily():
+    """
+    The final answer is kept in history but only serialized once the
+    conversation continues.
+    """
+    agent, llm = _make_agent([Message.assistant("first"), Message.assistant("second")])
+
+    agent.run("one")
+    assert [m.content for m in agent._history] == ["one", "first"]
+    assert len(agent._serialized_history) == 1
+
+    agent.run("two")
+    sent = llm.generate.call_args.kwargs["messages"]
+    assert [m["content"] for m in sent[1:]] == ["one", "first", "two"]
+
+
+@patch("vero.core.chat_openai.AsyncOpenAI")
+@patch("vero.core.chat_openai.OpenAI")
+def test_arun_twice_uses_a_client_per_event_loop(mock_openai_class, mock_async_openai_class):
+    """
+    Each asyncio.run() gets its own event loop, so the async client (whose
+    connection pool is bound to a loop) must not be reused across runs.
+    """
+    clients = []
+
+    def make_client(**kwargs):
+        client = MagicMock()
+        client.post = AsyncMock(return_value=SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="done", tool_calls=None))],
+            usage=None,
+        ))
+        clients.append(client)
+        return client
+
+    mock_async_openai_class.side_effect = make_client
+    llm = ChatOpenAI(api_key="dummy", base_url="https://dummy", model_name="test-model")
+    agent = OpenAIFunctionAgent("test-agent", llm, tools=[slow_echo])
+
+    assert asyncio.run(agent.arun("one")) == "done"
+    assert asyncio.run(agent.arun("two")) == "done"
+
+    assert len(clients) == 2
+    assert all(c.post.await_count == 1 for c in clients)
+
+
+def test_close_shuts_down_tool_executor():
+    with OpenAIFunctionAgent("test-agent", MagicMock(), tools=[slow_echo]) as agent:
+        pass
+
+    with pytest.raises(RuntimeError):
+        agent._tool_executor._pool.submit(print)
+
+
+def test_stream_passes_chunks_to_on_token(capsys):
+    """
+    Streamed text goes to the callback; the agent itself writes nothing.
+    """
+    response = MagicMock()
+    response.__iter__.return_value = iter(["Hel", "lo"])
+    response.result = Message.assistant("Hello")
+    llm = MagicMock()
+    llm.generate.return_value = response
+    tokens = []
+    agent = OpenAIFunctionAgent(
+        "test-agent", llm, tools=[slow_echo], stream=True, on_token=tokens.append
+    )
+
+    assert agent.run("hi") == "Hello"
+    assert tokens == ["Hel", "lo"]
+    assert capsys.readouterr().out == ""
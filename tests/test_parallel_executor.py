@@ -0,0 +1,94 @@
+import time
+import asyncio
+import threading
+
+import pytest
+
+from vero.core.exceptions import ToolCallError, ToolNotFoundError
+from vero.tool import tool, ParallelToolExecutor
+
+
+@tool
+def slow_echo(text: str, delay: float = 0.2) -> str:
+    """Echo the text back after sleeping for `delay` seconds."""
+    time.sleep(delay)
+    return text
+
+
+@tool
+def broken(x: int) -> int:
+    """Always fails."""
+    raise RuntimeError("boom")
+
+
+@tool
+async def async_echo(text: str) -> str:
+    """Echo the text back from a coroutine."""
+    await asyncio.sleep(0)
+    return text
+
+
+TOOLS = {t.name: t for t in (slow_echo, async_echo, broken)}
+
+
+def test_execute_runs_calls_concurrently_in_order():
+    # Only released once all three calls are in flight at the same time
+    barrier = threading.Barrier(3, timeout=5)
+
+    @tool
+    def rendezvous(text: str) -> str:
+        """Return the text once all concurrent calls have arrived."""
+        barrier.wait()
+        return text
+
+    executor = ParallelToolExecutor(max_workers=4)
+    calls = [("rendezvous", {"text": t}) for t in ("a", "b", "c")]
+
+    results = executor.execute({rendezvous.name: rendezvous}, calls)
+
+    assert results == ["a", "b", "c"]
+
+
+def test_execute_isolates_failures():
+    """
+    Every failure is reported in its own slot; the other calls still run.
+    """
+    executor = ParallelToolExecutor(max_workers=4)
+    calls = [
+        ("broken", {"x": 1}),
+        ("missing", {}),
+        ("slow_echo", None),
+        ("slow_echo", {"text": "ok", "delay": 0}),
+    ]
+
+    results = executor.execute(TOOLS, calls)
+
+    assert isinstance(results[0], ToolCallError)
+    assert isinstance(results[1], ToolNotFoundError)
+    assert isinstance(results[2], ToolCallError)
+    assert results[3] == "ok"
+
+
+def test_aexecute_mixes_sync_and_async_tools():
+    executor = ParallelToolExecutor(max_workers=2)
+    calls = [
+        ("slow_echo", {"text": "sync", "delay": 0}),
+        ("async_echo", {"text": "async"}),
+        ("broken", {"x": 1}),
+        ("missing", {}),
+    ]
+
+    results = asyncio.run(executor.aexecute(TOOLS, calls))
+
+    assert results[:2] == ["sync", "async"]
+    assert isinstance(results[2], ToolCallError)
+    assert isinstance(results[3], ToolNotFoundError)
+
+
+def test_context_manager_releases_workers():
+    with ParallelToolExecutor(max_workers=2) as executor:
+        calls = [("slow_echo", {"text": t, "delay": 0}) for t in ("a", "b")]
+        assert executor.execute(TOOLS, calls) == ["a", "b"]
+
+    with pytest.raises(RuntimeError):
+        executor._pool.submit(print)
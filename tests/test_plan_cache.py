@@ -0,0 +1,47 @@
+import time
+
+from vero.core import PlanCache
+
+
+VOCAB = ["add", "sum", "two", "numbers", "weather", "today"]
+
+
+def _bag_of_words(text: str):
+    words = text.lower().split()
+    return [float(words.count(w)) for w in VOCAB]
+
+
+def test_lookup_returns_similar_plan(tmp_path):
+    cache = PlanCache(str(tmp_path / "plans.sqlite"), embedder=_bag_of_words)
+    cache.add("add two numbers", cache.embed("add two numbers"), "Thought: ...", "3")
+
+    hit = cache.lookup(cache.embed("please add two numbers"))
+    assert hit is not None
+    assert hit.answer == "3"
+    assert hit.similarity >= cache.threshold
+
+    assert cache.lookup(cache.embed("weather today")) is None
+
+
+def test_plans_persist_across_instances(tmp_path):
+    path = str(tmp_path / "plans.sqlite")
+    PlanCache(path, embedder=_bag_of_words).add(
+        "sum numbers", _bag_of_words("sum numbers"), "", "42"
+    )
+
+    reopened = PlanCache(path, embedder=_bag_of_words)
+
+    assert len(reopened) == 1
+    assert reopened.lookup(reopened.embed("sum numbers")).answer == "42"
+
+
+def test_lookup_respects_scope_and_ttl(monkeypatch):
+    cache = PlanCache(embedder=_bag_of_words, ttl=60)
+    cache.add("add two numbers", cache.embed("add two numbers"), "", "3", scope="calc")
+
+    assert cache.lookup(cache.embed("add two numbers"), scope="calc").answer == "3"
+    assert cache.lookup(cache.embed("add two numbers"), scope="other") is None
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    assert cache.lookup(cache.embed("add two numbers"), scope="calc") is None
@@ -0,0 +1,282 @@
+import time
+import threading
+from unittest.mock import MagicMock
+
+from vero.core import Message
+from vero.agents import ReActAgent
+from vero.tool import tool
+
+
+@tool
+def slow_echo(text: str, delay: float = 0.2) -> str:
+    """Echo the text back after sleeping for `delay` seconds."""
+    time.sleep(delay)
+    return text
+
+
+def _make_agent(replies):
+    llm = MagicMock()
+    llm.generate.side_effect = replies
+    return ReActAgent("test-agent", llm, tools=[slow_echo]), llm
+
+
+def test_parse_react_step_accepts_multiple_actions():
+    agent, _ = _make_agent([])
+    text = (
+        "Thought: I need both.\n"
+        "Action: slow_echo\n"
+        'Action Input: {"text": "a"}\n'
+        "Action: slow_echo\n"
+        'Action Input: [{"text": "b"}, {"text": "c"}]\n'
+    )
+
+    assert agent._parse_react_step(text) == ("I need both.", [
+        ("slow_echo", {"text": "a"}),
+        ("slow_echo", {"text": "b"}),
+        ("slow_echo", {"text": "c"}),
+    ])
+
+
+def test_parse_react_step_reads_multiline_input():
+    agent, _ = _make_agent([])
+    text = (
+        "Thought: Compute\n"
+        "  step by step.\n"
+        "Action: slow_echo\n"
+        "Action Input: {\n"
+        '  "text": "a"\n'
+        "}\n"
+        "\n"
+        "Some trailing remark."
+    )
+
+    assert agent._parse_react_step(text) == (
+        "Compute\n  step by step.", [("slow_echo", {"text": "a"})]
+    )
+
+
+def test_parse_react_step_keeps_blank_lines_inside_json():
+    agent, _ = _make_agent([])
+    text = (
+        "Action: slow_echo\n"
+        "Action Input:\n"
+        "{\n"
+        '  "text": "a",\n'
+        "\n"
+        '  "delay": 0\n'
+        "}\n"
+        "\n"
+        "Action: slow_echo\n"
+        'Action Input: {"text": "b"}'
+    )
+
+    assert agent._parse_react_step(text)[1] == [
+        ("slow_echo", {"text": "a", "delay": 0}),
+        ("slow_echo", {"text": "b"}),
+    ]
+
+
+def test_parse_react_step_ignores_text_after_json():
+    agent, _ = _make_agent([])
+    text = 'Action: slow_echo\nAction Input: {"text": "a}"} then I will observe}'
+
+    assert agent._parse_react_step(text)[1] == [("slow_echo", {"text": "a}"})]
+
+
+def test_run_executes_actions_of_one_step_concurrently():
+    # Only released once both actions are in flight at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    @tool
+    def rendezvous(text: str) -> str:
+        """Return the text once all concurrent calls have arrived."""
+        barrier.wait()
+        return text
+
+    step = (
+        "Thought: Echo twice.\n"
+        "Action: rendezvous\n"
+        'Action Input: [{"text": "first"}, {"text": "second"}]'
+    )
+    finish = 'Thought: Done.\nAction: Finish\nAction Input: {"answer": "done"}'
+    llm = MagicMock()
+    llm.generate.side_effect = [Message.assistant(step), Message.assistant(finish)]
+    agent = ReActAgent("test-agent", llm, tools=[rendezvous])
+
+    answer = agent.run("echo")
+
+    assert answer == "done"
+    system_prompt = llm.generate.call_args_list[1].args[0][0]["content"]
+    assert system_prompt.index("Observation: first") < system_prompt.index("Observation: second")
+
+
+def test_run_recovers_from_unparseable_step():
+    finish = 'Thought: Done.\nAction: Finish\nAction Input: {"answer": "done"}'
+    agent, llm = _make_agent([Message.assistant("no format"), Message.assistant(finish)])
+
+    assert agent.run("hi") == "done"
+    assert "Invalid response format" in llm.generate.call_args_list[1].args[0][0]["content"]
+
+
+def test_system_prompt_matches_template_rendering():
+    agent, _ = _make_agent([])
+
+    expected = ReActAgent.DEFAULT_SYSTEM_PROMPT.format(
+        tool_descriptions=agent.tool_descriptions, scratchpad="step {1}"
+    )
+    assert agent._build_system_prompt("step {1}") == expected
+
+
+def test_plan_cache_returns_repeated_query_without_llm():
+    from vero.core import PlanCache
+
+    cache = PlanCache(embedder=lambda text: [1.0, float("echo" in text)])
+    finish = 'Thought: Done.\nAction: Finish\nAction Input: {"answer": "done"}'
+    llm = MagicMock()
+    llm.generate.side_effect = [Message.assistant(finish)]
+    agent = ReActAgent("test-agent", llm, tools=[slow_echo], plan_cache=cache)
+
+    assert agent.run("please echo") == "done"
+    assert agent.run("please echo") == "done"
+    assert llm.generate.call_count == 1
+    assert len(cache) == 1
+
+
+def test_plan_cache_seeds_similar_query_for_confirmation():
+    """
+    A similar (not identical) query is not answered blindly: the cached plan
+    is replayed in the scratchpad and the model confirms or adapts it.
+    """
+    from vero.core import PlanCache
+
+    cache = PlanCache(embedder=lambda text: [1.0, float("echo" in text)])
+    step = 'Thought: Echo.\nAction: slow_echo\nAction Input: {"text": "a", "delay": 0}'
+    llm = MagicMock()
+    llm.generate.side_effect = [
+        Message.assistant(step),
+        Message.assistant('Action: Finish\nAction Input: {"answer": "a"}'),
+        Message.assistant('Action: Finish\nAction Input: {"answer": "b"}'),
+    ]
+    agent = ReActAgent("test-agent", llm, tools=[slow_echo], plan_cache=cache)
+
+    assert agent.run("echo a") == "a"
+    assert agent.run("echo b") == "b"
+    assert llm.generate.call_count == 3
+
+    system = llm.generate.call_args.args[0][0]["content"]
+    assert "Observation: a" in system
+    assert "similar question ('echo a')" in system
+
+
+def test_plan_cache_is_scoped_to_agent_configuration():
+    from vero.core import PlanCache
+
+    @tool
+    def other(text: str) -> str:
+        """Another tool."""
+        return text
+
+    cache = PlanCache(embedder=lambda text: [1.0])
+    finish = 'Action: Finish\nAction Input: {"answer": "done"}'
+    llm = MagicMock()
+    llm.generate.side_effect = [Message.assistant(finish), Message.assistant(finish)]
+
+    ReActAgent("a", llm, tools=[slow_echo], plan_cache=cache).run("q")
+    ReActAgent("b", llm, tools=[other], plan_cache=cache).run("q")
+
+    assert llm.generate.call_count == 2
+
+
+class _FakeStream:
+    """Minimal StreamingResponse stand-in recording how far it was read."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+def test_stream_stops_after_action_input():
+    chunks = [
+        "Thought: Echo.\nAction: slow_echo\n",
+        'Action Input: {"text": "a}',
+        '", "delay": 0}\n',
+        "Action: slow_echo\nAction Input: [",
+        '{"text": "b", "delay": 0}]\n',
+        "Observation: made up",
+        " and never read",
+    ]
+    stream = _FakeStream(chunks)
+    agent, llm = _make_agent([])
+    agent.stream = True
+    llm.generate.side_effect = None
+    llm.generate.return_value = stream
+
+    text = agent._stream_until_action_input()
+
+    assert text.endswith('[{"text": "b", "delay": 0}]')
+    assert stream.consumed == 6
+    assert stream.closed
+    assert [a for a, _ in agent._parse_react_step(text)[1]] == ["slow_echo", "slow_echo"]
+
+
+def test_stream_scans_character_chunks_incrementally():
+    """
+    Unbuffered streams arrive a character at a time; the step is still cut
+    right after the input, and a non-JSON input is skipped over.
+    """
+    reply = (
+        "Thought: Echo.\nAction: slow_echo\nAction Input: none\n"
+        'Action: slow_echo\nAction Input: {"text": "a\\"}", "delay": 0}\n'
+        "Observation: made up"
+    )
+    stream = _FakeStream(list(reply))
+    agent, llm = _make_agent([])
+    llm.generate.side_effect = None
+    llm.generate.return_value = stream
+
+    text = agent._stream_until_action_input()
+
+    assert text.endswith('{"text": "a\\"}", "delay": 0}')
+    assert stream.consumed == len(reply) - len("bservation: made up")
+
+
+def test_prompt_cache_key_is_stable_across_turns():
+    """
+    With prompt caching, only the static part of the ReAct system prompt is
+    cached: the scratchpad changes every turn but the key and breakpoint do not.
+    """
+    from vero.core import ChatOpenAI
+
+    chat = ChatOpenAI(
+        api_key="dummy", base_url="https://dummy", model_name="test-model",
+        enable_prompt_cache=True,
+    )
+    sent = []
+    step = 'Thought: Echo.\nAction: slow_echo\nAction Input: {"text": "a", "delay": 0}'
+    finish = 'Thought: Done.\nAction: Finish\nAction Input: {"answer": "a"}'
+    replies = iter([Message.assistant(step), Message.assistant(finish)])
+
+    def generate(messages, **kwargs):
+        sent.append(chat._build_payload(messages, None, None, None, {}))
+        return next(replies)
+
+    chat.generate = generate
+    agent = ReActAgent("test-agent", chat, tools=[slow_echo])
+
+    assert agent.run("echo a") == "a"
+
+    first, second = sent
+    assert first["prompt_cache_key"] == second["prompt_cache_key"]
+    assert first["messages"][0]["content"][0] == second["messages"][0]["content"][0]
+    assert "cache_control" in first["messages"][0]["content"][0]
+    assert "Observation: a" in second["messages"][0]["content"][1]["text"]
+    assert "cache_control" not in second["messages"][0]["content"][1]
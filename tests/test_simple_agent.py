@@ -0,0 +1,84 @@
+import time
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from vero.core import Message
+from vero.agents import SimpleAgent
+from vero.tool import tool
+
+
+@tool
+def slow_echo(text: str, delay: float = 0.2) -> str:
+    """Echo the text back after sleeping for `delay` seconds."""
+    time.sleep(delay)
+    return text
+
+
+def test_run_executes_tool_calls_concurrently():
+    # Only released once both calls are in flight at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    @tool
+    def rendezvous(text: str) -> str:
+        """Return the text once all concurrent calls have arrived."""
+        barrier.wait()
+        return text
+
+    reply = (
+        'TOOL_CALL:rendezvous:{"text": "first"}\n'
+        'TOOL_CALL:missing:{}\n'
+        'TOOL_CALL:rendezvous:{"text": "second"}'
+    )
+    llm = MagicMock()
+    llm.generate.side_effect = [Message.assistant(reply), Message.assistant("final")]
+    agent = SimpleAgent("test-agent", llm, tools=[rendezvous])
+
+    answer = agent.run("echo")
+
+    assert answer == "final"
+    assert all(isinstance(m, dict) for m in llm.generate.call_args.args[0])
+    results = [m.content for m in agent._history if m.content.startswith("TOOL_RESULT")]
+    assert results == [
+        "TOOL_RESULT:rendezvous:first",
+        "TOOL_RESULT:missing:Unknown tool: missing",
+        "TOOL_RESULT:rendezvous:second",
+    ]
+
+
+def test_tool_metadata_is_built_once():
+    agent = SimpleAgent("test-agent", MagicMock(), tools=[slow_echo])
+
+    assert agent.tool_names == "slow_echo"
+    assert agent.tool_descriptions.startswith("slow_echo(text: ")
+    assert agent.tool_descriptions is agent.tool_descriptions
+
+
+def test_parse_params_fallbacks():
+    parse = SimpleAgent._parse_params
+
+    assert parse('{"a": 1}') == {"a": 1}
+    assert parse("{'a': 'b'}") == {"a": "b"}
+    assert parse("{'a': \"it's\", 'b': True}") == {"a": "it's", "b": True}
+    assert parse("not a dict(") is None
+
+
+def test_subclass_can_override_tool_call_pattern():
+    class CallAgent(SimpleAgent):
+        TOOL_CALL_PATTERN = r"CALL (\w+) (.+)"
+
+    agent = CallAgent("test-agent", MagicMock(), tools=[slow_echo])
+
+    assert agent._parse_tool_call('CALL slow_echo {"text": "x"}') == [
+        ("slow_echo", {"text": "x"})
+    ]
+    assert SimpleAgent.TOOL_CALL_RE.pattern == SimpleAgent.TOOL_CALL_PATTERN
+
+
+def test_agent_close_shuts_down_tool_executor():
+    with SimpleAgent("test-agent", MagicMock(), tools=[slow_echo]) as agent:
+        pass
+
+    with pytest.raises(RuntimeError):
+        agent._tool_executor._pool.submit(print)
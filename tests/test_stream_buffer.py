@@ -0,0 +1,71 @@
+import time
+from types import SimpleNamespace
+
+from vero.core import StreamBuffer
+from vero.core.chat_openai import StreamingResponse
+
+
+def test_flushes_when_size_limit_reached():
+    buffer = StreamBuffer(max_bytes=5, flush_interval_ms=10_000)
+
+    assert buffer.push("ab") is None
+    assert buffer.push("cd") is None
+    assert buffer.push("ef") == "abcdef"
+    assert buffer.flush() is None
+
+
+def test_flushes_after_interval():
+    buffer = StreamBuffer(max_bytes=8192, flush_interval_ms=20)
+
+    assert buffer.push("a") is None
+    time.sleep(0.05)
+    assert buffer.push("b") == "ab"
+
+
+def test_flush_returns_remaining_text():
+    buffer = StreamBuffer()
+
+    buffer.push("tail")
+    assert buffer.flush() == "tail"
+
+
+def test_poll_releases_text_after_interval_only():
+    buffer = StreamBuffer(max_bytes=8192, flush_interval_ms=20)
+
+    assert buffer.poll() is None
+    buffer.push("a")
+    assert buffer.poll() is None
+    time.sleep(0.05)
+    assert buffer.poll() == "a"
+    assert buffer.poll() is None
+
+
+def test_text_is_not_held_back_by_tool_call_deltas():
+    """
+    Buffered text is released while the model streams tool-call deltas,
+    not only when the stream ends.
+    """
+    def _chunk(content=None, tool_calls=None):
+        delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+        return SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=delta)])
+
+    call = SimpleNamespace(
+        index=0, id="call_0", function=SimpleNamespace(name="f", arguments="{}")
+    )
+    events = []
+
+    def _stream():
+        yield _chunk(content="Let me check.")
+        time.sleep(0.05)
+        events.append("tool delta")
+        yield _chunk(tool_calls=[call])
+        events.append("end")
+
+    response = StreamingResponse(
+        _stream(), StreamBuffer(max_bytes=8192, flush_interval_ms=20)
+    )
+    for text in response:
+        events.append(text)
+
+    assert events == ["tool delta", "Let me check.", "end"]
+    assert response.result.tool_calls[0]["function"]["name"] == "f"
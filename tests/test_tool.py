@@ -1,4 +1,5 @@
 import json
+import inspect
 from typing import Optional, List, Dict
 
 import pytest
@@ -114,3 +115,70 @@ def test_schema_is_json_serializable(search_tool):
     """
     schema = search_tool.to_openai_schema()
     json.dumps(schema)  # should not raise
+
+
+def test_schema_is_built_once(search_tool):
+    """
+    The schema is computed at decoration time and reused on every call.
+    """
+    assert search_tool.to_openai_schema() is search_tool.to_openai_schema()
+
+
+def test_shared_annotation_fragments_are_not_mutated():
+    """
+    Parameters sharing an annotation across tools keep their own description.
+    """
+
+    @tool
+    def first(text: str) -> str:
+        """First tool."""
+        return text
+
+    @tool
+    def second(query: str) -> str:
+        """Second tool."""
+        return query
+
+    first_props = first.to_openai_schema()["function"]["parameters"]["properties"]
+    second_props = second.to_openai_schema()["function"]["parameters"]["properties"]
+
+    assert first_props["text"]["description"] == "text"
+    assert second_props["query"]["description"] == "query"
+
+
+def test_signature_is_shared_with_decorator(search_tool):
+    """
+    The decorator inspects the function once and hands the signature to Tool.
+    """
+    assert search_tool.signature == inspect.signature(search_tool.func)
+
+    def prebuilt(x):
+        return x
+
+    prebuilt.__signature__ = inspect.Signature(
+        [inspect.Parameter("x", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=int)]
+    )
+    assert tool(prebuilt).signature is prebuilt.__signature__
+
+
+def test_to_string_is_precomputed(search_tool):
+    text = search_tool.to_string()
+
+    assert text.startswith("search(query: str, top_k: int, filters: ")
+    assert search_tool.to_string() is text
+
+
+def test_pep604_optional_matches_typing_optional():
+    @tool
+    def lookup(key: str, limit: int | None = None) -> str:
+        """Look up a key."""
+        return key
+
+    params = lookup.to_openai_schema()["function"]["parameters"]
+    assert params["properties"]["limit"]["anyOf"] == [{"type": "integer"}, {"type": "null"}]
+    assert params["required"] == ["key"]
+
+
+def test_invoke_is_the_wrapped_function(search_tool):
+    assert search_tool.invoke is search_tool.func
+    assert search_tool.invoke("q") == search_tool("q")
@@ -1,12 +1,17 @@
-import json
-import time
-from typing import Optional, List, Dict, Any
+import logging
+from typing import Callable, Optional, List, Dict, Any, Tuple
 
-from vero.tool import Tool
+from vero.tool import Tool, ToolResult, ParallelToolExecutor
 from vero.core.message import Message
-from vero.core.chat_openai import ChatOpenAI
+from vero.core.chat_openai import ChatOpenAI, mark_cacheable
 from vero.core.agent import Agent
-from vero.core.exceptions import ToolNotFoundError
+from vero.core.debug import sync_debug_level
+from vero.core.exceptions import ToolError, ToolNotFoundError
+from vero.core import json_utils
+
+
+# Child of the "vero" logger, whose level follows `settings.debug`
+logger = logging.getLogger("vero.agent")
 
 
 class OpenAIFunctionAgent(Agent):
@@ -15,9 +20,11 @@ class OpenAIFunctionAgent(Agent):
 
     Features:
         - Supports multiple tool calls in a single assistant message
-        - Automatically executes tools
+        - Automatically executes tools (concurrently when several are requested)
         - Feeds tool outputs back to the model
         - Iterates until a final text answer is produced
+        - Keeps the static request prefix (system prompt + tool schemas)
+          byte-identical across turns so provider-side prompt caching applies
     """
 
     def __init__(
@@ -28,6 +35,10 @@ class OpenAIFunctionAgent(Agent):
         system_prompt: Optional[str] = None,
         max_turns: int = 5,
         tool_choice: str = "auto",
+        max_tool_concurrency: Optional[int] = None,
+        stream: bool = False,
+        enable_prompt_cache: bool = False,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> None:
         """
         Initialize OpenAIFunctionAgent.
@@ -39,8 +50,20 @@ class OpenAIFunctionAgent(Agent):
             system_prompt: Optional system prompt override.
             max_turns: Maximum number of reasoning / tool-execution loops.
             tool_choice: OpenAI tool_choice parameter ("auto", "none", or forced tool).
+            max_tool_concurrency: Maximum number of tool calls executed in parallel
+                                  when the model requests several tools in one turn.
+                                  Defaults to `settings.tool_concurrency`.
+            stream: If True, request a streamed response and build the assistant
+                    message from it; text chunks are passed to `on_token` as
+                    they arrive.
+            enable_prompt_cache: If True, tag the end of the static prefix with an
+                                 explicit `cache_control` marker, for providers
+                                 (e.g. Anthropic) that require one.
+            on_token: Optional callback receiving each streamed text chunk
+                      (e.g. to display it). Only used when `stream` is True.
         """
-        print(f"🚀 Initializing OpenAIFunctionAgent `{name}` ...")
+        sync_debug_level()
+        logger.info("🚀 Initializing OpenAIFunctionAgent `%s` ...", name)
 
         super().__init__(
             name=name,
@@ -51,13 +74,32 @@ class OpenAIFunctionAgent(Agent):
         )
 
         self.tool_choice = tool_choice
-        self.tools_schema = self._build_tool_schemas()
+        self.stream = stream
+        self.on_token = on_token
+        # Frozen so the schemas sent on every turn cannot drift
+        self.tools_schema = tuple(self._build_tool_schemas())
+        self.enable_prompt_cache = enable_prompt_cache
+
+        # Tool-related request arguments, identical on every turn. tool_choice is
+        # only valid alongside tools, so both are omitted for tool-less agents.
+        self._tool_request_kwargs: Dict[str, Any] = (
+            {"tools": self.tools_schema, "tool_choice": self.tool_choice}
+            if self.tools_schema
+            else {}
+        )
+
+        self._tool_executor = ParallelToolExecutor(max_tool_concurrency)
 
-        print(f"🛠️ Registered tools: {self.tools}")
-        print(f"⚙️ Tool choice mode: {self.tool_choice}")
+        logger.info("🛠️ Registered tools: %s", self.tools)
+        logger.info("⚙️ Tool choice mode: %s", self.tool_choice)
 
-        # Initialize conversation with system prompt
-        self.add_message(Message.system(self._build_system_prompt()))
+        # Static request prefix, kept outside the history and never mutated.
+        # Providers cache on the request prefix, so every turn after the first
+        # reuses it; `_history` only holds the dynamic part of the conversation.
+        system_msg = Message.system(self._build_system_prompt()).to_dict()
+        if self.enable_prompt_cache:
+            system_msg = mark_cacheable(system_msg)
+        self._static_prefix_messages: Tuple[dict, ...] = (system_msg,)
 
     # ------------------------------------------------------------------
     # System prompt
@@ -95,86 +137,231 @@ class OpenAIFunctionAgent(Agent):
             3. If tool_calls exist:
                 - Execute each tool
                 - Inject tool results as Message.tool
+                - Stop early if a tool returned a final `ToolResult`
             4. Repeat until a pure text response is produced
         """
-        print("\n==============================")
-        print(f"👤 User Input: {user_query}")
-        print("==============================\n")
+        sync_debug_level()
+        logger.info("👤 User Input: %s", user_query)
 
         self.add_message(Message.user(user_query))
 
         for turn_idx in range(1, self.max_turns + 1):
-            print(f"🔁 Turn {turn_idx}/{self.max_turns}")
+            logger.info("🔁 Turn %d/%d", turn_idx, self.max_turns)
 
-            assistant_msg: Message = self.llm.generate(
-                messages=self._history,
-                tools=self.tools_schema,
-                tool_choice=self.tool_choice,
-            )
-
-            print(
-                f"📤 LLM Assistant Message | "
-                f"content={assistant_msg.content!r}, "
-                f"tool_calls={bool(assistant_msg.tool_calls)}"
-            )
-
-            self.add_message(assistant_msg)
+            assistant_msg = self._generate()
 
             # -------------------------------------------------
             # Case A: Final text response (no tool calls)
             # -------------------------------------------------
+            # Checked first: the final message is kept in history but not
+            # serialized, since it is not sent again during this run.
             if not assistant_msg.tool_calls:
-                print("💬 No tool calls detected. Returning final answer.\n")
+                logger.info("💬 No tool calls detected. Returning final answer.")
+                self.add_final_message(assistant_msg)
                 return assistant_msg.content or ""
 
+            logger.debug("📤 LLM Assistant tool calls: %s", assistant_msg.tool_calls)
+            self.add_message(assistant_msg)
+
             # -------------------------------------------------
             # Case B: Tool calls detected
             # -------------------------------------------------
-            for tc in assistant_msg.tool_calls:
-                func = tc["function"]
-                tool_name = func["name"]
-                args_text = func["arguments"]
-                tool_call_id = tc["id"]
-
-                print(
-                    f"🧩 Tool call detected → "
-                    f"name={tool_name}, id={tool_call_id}, raw_args={args_text}"
-                )
-
-                # Parse arguments (OpenAI guarantees JSON string)
-                try:
-                    args = json.loads(args_text)
-                    print("📦 Tool arguments parsed successfully.")
-                except Exception as e:
-                    print(f"❌ Failed to parse tool arguments: {e}")
-                    args = {}
-
-                # Lookup tool
-                tool: Tool | None = self.tool_by_names.get(tool_name)
-                if not tool:
-                    print("❌ Tool not found!")
-                    raise ToolNotFoundError(f"Unknown tool: {tool_name}")
-
-                # Execute tool
-                print(f"🔧 Executing tool `{tool_name}` with args={args}")
-                try:
-                    start = time.perf_counter()
-                    output = tool(**args)
-                    cost = time.perf_counter() - start
-                    print(f"📦 Tool output: {output} | ⏱️ Cost: {cost:.3f}s")
-                except Exception as e:
-                    output = f"Tool execution failed: {e}"
-                    print(f"💥 Tool execution failed: {e}")
-
-                # Inject tool result back into history
-                print("📥 Injecting tool result into conversation history.")
-                self.add_message(
-                    Message.tool(
-                        content=str(output),
-                        tool_call_id=tool_call_id,
-                    )
-                )
+            # The tool calls run concurrently; results come back in the
+            # original order so the model sees them in the same sequence as
+            # `tool_calls`. History is only mutated on this thread.
+            calls = self._prepare_tool_calls(assistant_msg.tool_calls)
+            outcomes = self._tool_executor.execute(self.tool_by_names, calls)
+
+            final_answer = None
+            for tc, outcome in zip(assistant_msg.tool_calls, outcomes):
+                answer = self._add_tool_result(tc, outcome)
+                if final_answer is None:
+                    final_answer = answer
+
+            # A tool already produced the final answer: skip the extra LLM turn
+            if final_answer is not None:
+                return self._finish_with_tool_answer(final_answer)
 
             # Continue loop, letting the model consume tool results
 
         raise RuntimeError("Reached max_turns without producing a final answer")
+
+    async def arun(self, user_query: str) -> str:
+        """
+        Async counterpart of `run`.
+
+        LLM calls go through `ChatOpenAI.agenerate`, and the tool calls of a turn
+        are awaited together via `ParallelToolExecutor.aexecute`: `async def`
+        tools run on the event loop, synchronous tools on the tool thread pool
+        so they never block it. Results are injected in the original
+        `tool_calls` order.
+        """
+        sync_debug_level()
+        logger.info("👤 User Input: %s", user_query)
+
+        self.add_message(Message.user(user_query))
+
+        for turn_idx in range(1, self.max_turns + 1):
+            logger.info("🔁 Turn %d/%d", turn_idx, self.max_turns)
+
+            assistant_msg: Message = await self.llm.agenerate(
+                messages=self._request_messages(),
+                **self._tool_request_kwargs,
+            )
+
+            if not assistant_msg.tool_calls:
+                logger.info("💬 No tool calls detected. Returning final answer.")
+                self.add_final_message(assistant_msg)
+                return assistant_msg.content or ""
+
+            logger.debug("📤 LLM Assistant tool calls: %s", assistant_msg.tool_calls)
+            self.add_message(assistant_msg)
+
+            calls = self._prepare_tool_calls(assistant_msg.tool_calls)
+            outcomes = await self._tool_executor.aexecute(self.tool_by_names, calls)
+            final_answer = None
+            for tc, outcome in zip(assistant_msg.tool_calls, outcomes):
+                answer = self._add_tool_result(tc, outcome)
+                if final_answer is None:
+                    final_answer = answer
+
+            if final_answer is not None:
+                return self._finish_with_tool_answer(final_answer)
+
+        raise RuntimeError("Reached max_turns without producing a final answer")
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _generate(self) -> Message:
+        """
+        Ask the LLM for the next assistant message.
+
+        In streaming mode the text is handed to `on_token` as it arrives and
+        the structured message (content + tool_calls) is taken from the same
+        response, so a single request serves both the UI and the reasoning loop.
+        """
+        messages = self._request_messages()
+
+        if not self.stream:
+            return self.llm.generate(
+                messages=messages,
+                **self._tool_request_kwargs,
+            )
+
+        response = self.llm.generate(
+            messages=messages,
+            stream=True,
+            **self._tool_request_kwargs,
+        )
+        on_token = self.on_token
+        for chunk in response:
+            if on_token is not None:
+                on_token(chunk)
+        return response.result
+
+    def _request_messages(self) -> List[dict]:
+        """
+        Compose the request messages: static prefix first, then the history.
+        """
+        return [*self._static_prefix_messages, *self._sync_serialized_history()]
+
+    def _prepare_tool_calls(
+        self, tool_calls: List[Dict[str, Any]]
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Parse arguments and check the tool of every requested tool call.
+
+        Returns:
+            List of (tool_name, args) tuples, in request order, as accepted by
+            `ParallelToolExecutor.execute`.
+
+        Raises:
+            ToolNotFoundError: If the model requested an unregistered tool.
+        """
+        calls = []
+        for tc in tool_calls:
+            func = tc["function"]
+            tool_name = func["name"]
+            args_text = func["arguments"]
+            tool_call_id = tc["id"]
+
+            logger.debug(
+                "🧩 Tool call detected → name=%s, id=%s, raw_args=%s",
+                tool_name, tool_call_id, args_text,
+            )
+
+            args = self._parse_tool_arguments(args_text)
+
+            # Lookup tool
+            if tool_name not in self.tool_by_names:
+                logger.warning("❌ Tool not found: %s", tool_name)
+                raise ToolNotFoundError(f"Unknown tool: {tool_name}")
+
+            logger.info("🔧 Executing tool `%s` with args=%s", tool_name, args)
+            calls.append((tool_name, args))
+
+        return calls
+
+    @staticmethod
+    def _parse_tool_arguments(args_text: Optional[str]) -> Dict[str, Any]:
+        """
+        Parse the JSON arguments of a tool call into a dict.
+
+        Empty arguments (no-parameter tools) and anything that cannot be a JSON
+        object are rejected by a cheap prefix check instead of a failed parse.
+        Malformed arguments fall back to an empty dict.
+        """
+        args_text = (args_text or "").strip()
+        if not args_text:
+            return {}
+
+        if args_text[0] != "{":
+            logger.warning("❌ Tool arguments are not a JSON object: %.50r", args_text)
+            return {}
+
+        try:
+            return json_utils.loads(args_text)
+        except json_utils.JSONDecodeError as e:
+            logger.warning("❌ Failed to parse tool arguments: %s", e)
+            return {}
+
+    def _add_tool_result(
+        self, tc: Dict[str, Any], outcome: Any
+    ) -> Optional[str]:
+        """
+        Inject the outcome of a tool call (its output, or the ToolError reported
+        by the executor) into the conversation history.
+
+        Returns:
+            The answer text if the tool returned a final `ToolResult`, else None.
+        """
+        tool_name = tc["function"]["name"]
+        output = outcome
+        if isinstance(outcome, ToolError):
+            logger.warning("💥 Tool `%s`: %s", tool_name, outcome)
+
+        # Inject tool result back into history
+        self.add_message(
+            Message.tool(
+                content=str(output),
+                tool_call_id=tc["id"],
+            )
+        )
+
+        if isinstance(output, ToolResult) and output.final:
+            return str(output.content)
+        return None
+
+    def _finish_with_tool_answer(self, answer: str) -> str:
+        """
+        End the run with an answer produced directly by a tool, recording it
+        as the assistant reply so the history stays well-formed.
+        """
+        logger.info("🏁 Tool returned a final answer. Skipping the next LLM turn.")
+        self.add_final_message(Message.assistant(answer))
+        return answer
+
+    def close(self) -> None:
+        """Shut down the tool executor."""
+        self._tool_executor.close()
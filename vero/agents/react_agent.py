@@ -1,17 +1,75 @@
-import re
-import ast
-import json
-import time
+import hashlib
+from typing import Any, List, Optional, Tuple, Dict, Union
 
-from typing import List, Optional, Tuple, Dict
-
-from vero.tool import Tool
+from vero.tool import Tool, ParallelToolExecutor
 from vero.core.message import Message
 from vero.core.chat_openai import ChatOpenAI
 from vero.core.agent import Agent
+from vero.core.debug import log_debug
+from vero.core import json_utils
+from vero.core.plan_cache import CachedPlan, PlanCache
+from vero.config import settings
 from vero.core.exceptions import ToolNotFoundError, ToolCallError
 
 
+class _JsonValueScanner:
+    """
+    Resumable bracket matcher for a JSON object/array in a growing text.
+
+    `feed` scans only the characters appended since the previous call, so
+    matching a streamed value costs O(length) overall. Whitespace before the
+    opening bracket is skipped; if the value does not start with `{` or
+    `[`, `invalid` is set.
+    """
+
+    __slots__ = ("pos", "depth", "in_string", "escaped", "invalid")
+
+    def __init__(self, start: int) -> None:
+        self.pos = start
+        self.depth = 0
+        self.in_string = self.escaped = False
+        self.invalid = False
+
+    def feed(self, text: str) -> Optional[int]:
+        """
+        Continue scanning `text` (a superset of the previously fed text).
+
+        Returns:
+            The index just past the closed value, or None if it is not closed
+            yet (or `invalid`).
+        """
+        if self.invalid:
+            return None
+
+        depth, in_string, escaped = self.depth, self.in_string, self.escaped
+        for idx in range(self.pos, len(text)):
+            ch = text[idx]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch in "{[":
+                depth += 1
+            elif ch in "}]":
+                depth -= 1
+                if depth == 0:
+                    self.pos, self.depth = idx + 1, 0
+                    return idx + 1
+            elif depth == 0 and ch not in " \t\r\n":
+                self.pos, self.invalid = idx, True
+                return None
+
+        self.pos, self.depth, self.in_string, self.escaped = (
+            len(text), depth, in_string, escaped,
+        )
+        return None
+
+
 class ReActAgent(Agent):
     """
     A concrete Agent implementation that uses a ReAct protocol.
@@ -48,6 +106,9 @@ Thought: <your reasoning for the next step>
 Action: <one of the available tool names OR Finish>
 Action Input: <JSON object>
 
+To call several independent tools at once, repeat the Action / Action Input
+lines once per call; all of them are executed before the next step.
+
 ### Rules for Action Input
 
 - Action Input MUST be a valid JSON object.
@@ -70,6 +131,9 @@ Action Input: {{"answer": "The result is 3"}}
 Now produce the NEXT step only.
 """
 
+    # Placeholder substituted for {scratchpad} when pre-rendering the template
+    _SCRATCHPAD_SLOT = "\x00scratchpad\x00"
+
 
 
     def __init__(
@@ -79,6 +143,9 @@ Now produce the NEXT step only.
         tools: List[Tool],
         system_prompt: Optional[str] = None,
         max_turns: int = 3,
+        max_tool_concurrency: Optional[int] = None,
+        plan_cache: Optional[PlanCache] = None,
+        stream: bool = False,
     ) -> None:
         """
         Initialize SimpleAgent.
@@ -90,24 +157,79 @@ Now produce the NEXT step only.
             system_prompt: Optional system prompt override. If omitted, a prompt
                            is generated from the provided tools.
             max_turns: Reserved for future use (e.g., limit recursive tool calls).
+            max_tool_concurrency: Maximum number of tool calls executed in parallel
+                           within a single step (defaults to settings.tool_concurrency).
+            plan_cache: Optional PlanCache consulted before planning. A repeated
+                           query returns its cached answer; a similar one seeds
+                           the scratchpad with the cached plan for the model to
+                           confirm. When omitted, an in-memory one is created if
+                           settings.plan_cache_enabled.
+            stream: If True, stream each reply and stop reading it as soon as the
+                           requested Action Inputs are complete, so tools start
+                           while the model would still be generating filler.
         """
-        print(f"🚀 Initializing ReActAgent `{name}` ...")
+        log_debug(f"🚀 Initializing ReActAgent `{name}` ...")
 
         assert tools, "ReActAgent must have at least one tool."
 
         super().__init__(name=name, llm=llm, tools=tools, system_prompt=system_prompt, max_turns=max_turns)
 
         self.system_prompt = system_prompt or self.DEFAULT_SYSTEM_PROMPT
+        self._tool_executor = ParallelToolExecutor(max_tool_concurrency)
+        if plan_cache is None and settings.plan_cache_enabled:
+            plan_cache = PlanCache()
+        self.plan_cache = plan_cache
+        self.stream = stream
+
+        # Only the scratchpad changes between turns: render the template once
+        # and keep the text around the scratchpad slot.
+        rendered = self.system_prompt.format(
+            tool_descriptions=self.tool_descriptions,
+            scratchpad=self._SCRATCHPAD_SLOT,
+        )
+        prefix, slot, suffix = rendered.partition(self._SCRATCHPAD_SLOT)
+        # Plans are only shared between agents with the same tools and prompt
+        self._plan_scope = hashlib.sha256(rendered.encode("utf-8")).hexdigest()
+        self._system_prompt_prefix = prefix
+        self._system_prompt_suffix = suffix
+        self._has_scratchpad_slot = bool(slot)
+
+        # With prompt caching, the system message is sent as two blocks: the
+        # static prefix (tools, instructions) carrying the cache breakpoint,
+        # then the per-turn scratchpad. The cache key and breakpoint then
+        # cover only text that is identical on every turn.
+        self._prompt_cache_blocks = (
+            getattr(llm, "enable_prompt_cache", False) is True and self._has_scratchpad_slot
+        )
+        self._static_system_block = {
+            "type": "text",
+            "text": prefix,
+            "cache_control": {"type": "ephemeral"},
+        }
+
     def _build_system_prompt(self, scratchpad: str) -> str:
         """
         Generate the system prompt with current scratchpad.
         """
-        return self.system_prompt.format(
-            tool_descriptions=self.tool_descriptions,
-            scratchpad=scratchpad
-        )
+        if not self._has_scratchpad_slot:
+            return self._system_prompt_prefix
+        return self._system_prompt_prefix + scratchpad + self._system_prompt_suffix
 
-    def _parse_react_step(self, text: str) -> Tuple[str, Dict]:
+    def _build_system_content(self, scratchpad: str) -> Union[str, List[dict]]:
+        """
+        Generate the system message content with current scratchpad: the
+        prompt string, or the static and per-turn blocks when prompt caching
+        is enabled on the LLM.
+        """
+        if not self._prompt_cache_blocks:
+            return self._build_system_prompt(scratchpad)
+
+        dynamic = scratchpad + self._system_prompt_suffix
+        if not dynamic:
+            return [self._static_system_block]
+        return [self._static_system_block, {"type": "text", "text": dynamic}]
+
+    def _parse_react_step(self, text: str) -> Tuple[str, List[Tuple[str, Any]]]:
         """
         Parse a ReAct-style response.
 
@@ -116,41 +238,94 @@ Now produce the NEXT step only.
             Action: <tool_name | Finish>
             Action Input: <JSON>
 
+        Several tool calls can be requested in one step by repeating the
+        Action / Action Input pair, or by giving a JSON array of argument
+        objects as the Action Input (one call per element).
+
+        The text is scanned once, line by line, dispatching on the line prefix.
+        An Action Input may span several lines (pretty-printed JSON, blank
+        lines included); it ends where its JSON value closes, at the next
+        Thought/Action line, or at the end of the text.
+
         Returns:
-            (action, action_input)
+            (thought, steps): the reasoning text and a list of
+            (action, action_input) pairs, in order.
 
         Raises:
             ValueError if parsing fails.
         """
-        print("🔍 Parsing ReAct output...")
+        log_debug("🔍 Parsing ReAct output...")
 
-        # 1. Extract Action
-        action_match = re.search(r"^Action:\s*(.+)$", text, re.MULTILINE)
-        if not action_match:
+        thought_lines: List[str] = []
+        raw_steps: List[List] = []  # [action, action_input_text | None]
+        section = None  # "thought" | "input" | None
+        raw_input = ""  # text of the open Action Input (section == "input")
+        scanner: Optional[_JsonValueScanner] = None
+
+        for line in text.splitlines():
+            stripped = line.strip()
+
+            if section == "input" and not stripped.startswith(("Action:", "Action Input:", "Thought:")):
+                raw_input += "\n" + line
+            else:
+                if section == "input":
+                    # Interrupted before its JSON value was closed
+                    raw_steps[-1][1] = raw_input
+                    section = None
+
+                if stripped.startswith("Action Input:"):
+                    if not raw_steps or raw_steps[-1][1] is not None:
+                        raise ValueError("Action Input without a preceding Action.")
+                    raw_input = stripped[len("Action Input:"):]
+                    scanner = _JsonValueScanner(0)
+                    section = "input"
+                elif stripped.startswith("Action:"):
+                    action = stripped[len("Action:"):].strip()
+                    log_debug(f"🧩 Action detected: {action}")
+                    raw_steps.append([action, None])
+                elif stripped.startswith("Thought:"):
+                    # Only the reasoning before the first Action is kept
+                    section = "thought" if not raw_steps else None
+                    if section:
+                        thought_lines.append(stripped[len("Thought:"):])
+                elif section == "thought":
+                    thought_lines.append(line)
+
+            if section == "input":
+                # The input ends once its JSON value is closed (blank lines
+                # inside pretty-printed JSON are kept) or once it is not JSON;
+                # anything the model wrote after the value is dropped
+                end = scanner.feed(raw_input)
+                if end is not None or scanner.invalid:
+                    raw_steps[-1][1] = raw_input if end is None else raw_input[:end]
+                    section = None
+
+        if section == "input":
+            raw_steps[-1][1] = raw_input
+
+        if not raw_steps:
             raise ValueError("Missing Action field in ReAct output.")
 
-        action = action_match.group(1).strip()
-        print(f"🧩 Action detected: {action}")
+        steps = []
+        for action, raw_input in raw_steps:
+            raw_input = (raw_input or "").strip()
+            if not raw_input.startswith(("{", "[")) or not raw_input.endswith(("}", "]")):
+                raise ValueError("Missing or invalid Action Input field.")
 
-        # 2. Extract Action Input
-        input_match = re.search(
-            r"^Action Input:\s*(\{.*\})\s*$",
-            text,
-            re.MULTILINE | re.DOTALL,
-        )
-        if not input_match:
-            raise ValueError("Missing or invalid Action Input field.")
+            log_debug(f"📦 Raw Action Input: {raw_input}")
 
-        raw_input = input_match.group(1).strip()
-        print(f"📦 Raw Action Input: {raw_input}")
+            # Parse JSON strictly
+            try:
+                action_input = json_utils.loads(raw_input)
+            except json_utils.JSONDecodeError as e:
+                raise ValueError(f"Action Input is not valid JSON: {e}")
 
-        # 3. Parse JSON strictly
-        try:
-            action_input = json.loads(raw_input)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Action Input is not valid JSON: {e}")
+            if isinstance(action_input, list):
+                steps.extend((action, item) for item in action_input)
+            else:
+                steps.append((action, action_input))
 
-        return action, action_input
+        return "\n".join(thought_lines).strip(), steps
 
 
     def run(self, user_input: str) -> str:
@@ -163,71 +338,101 @@ Now produce the NEXT step only.
             - Strict JSON parsing for Action Input
             - Tool execution via _handle_tool_call
             - Finish detection
+            - Plan cache lookup / insert (when a PlanCache is configured)
         """
-        print(f"\n==============================")
-        print(f"👤 User Input: {user_input}")
-        print("==============================\n")
+        log_debug(f"\n==============================")
+        log_debug(f"👤 User Input: {user_input}")
+        log_debug("==============================\n")
 
-        # 1. Initialize empty scratchpad
-        scratchpad = ""
+        # 1. Initialize empty scratchpad (one fragment per step, joined on use)
+        scratchpad_parts: List[str] = []
 
         # 2. Append user input to _history
         self.add_message(Message.user(user_input))
 
+        # Plan cache: the same query answered before is returned as is; a
+        # similar one seeds the scratchpad so the model confirms or adapts
+        # the cached plan instead of planning from scratch
+        query_embedding = None
+        cached = None
+        if self.plan_cache is not None:
+            query_embedding = self.plan_cache.embed(user_input)
+            cached = self.plan_cache.lookup(query_embedding, scope=self._plan_scope)
+            if cached is not None:
+                log_debug(f"♻️ Plan cache hit (similarity={cached.similarity:.3f}): {cached.query!r}")
+                if cached.query == user_input:
+                    self.add_message(Message.assistant(cached.answer))
+                    return cached.answer
+                scratchpad_parts.append(self._plan_cache_seed(cached))
+        seeded = len(scratchpad_parts)
+
         for turn_idx in range(1, self.max_turns + 1):
-            print(f"🔁 Turn {turn_idx}/{self.max_turns}")
+            log_debug(f"🔁 Turn {turn_idx}/{self.max_turns}")
 
             # 3. Update system message with latest scratchpad
-            system_prompt = self._build_system_prompt(scratchpad)
-            print(f"📝 System Prompt: #######################################\n{system_prompt}\n#######################################")
-            if self._history and self._history[0].role == "system":
-                self._history[0].content = system_prompt
-            else:
-                # fallback: ensure at least one system message exists
-                self._history.insert(0, Message.system(system_prompt))
+            scratchpad = "\n".join(scratchpad_parts)
+            if settings.debug:
+                system_prompt = self._build_system_prompt(scratchpad)
+                log_debug(f"📝 System Prompt: #######################################\n{system_prompt}\n#######################################")
+            self._set_system_message(self._build_system_content(scratchpad))
 
             # 4. Ask LLM
-            assistant_msg: Message = self.llm.generate(self._history)
-            print(f"📤 LLM Assistant Message:\n{assistant_msg.content}\n")
-
-            content = assistant_msg.content or ""
+            if self.stream:
+                content = self._stream_until_action_input()
+            else:
+                assistant_msg: Message = self.llm.generate(self._sync_serialized_history())
+                content = assistant_msg.content or ""
+            log_debug(f"📤 LLM Assistant Message:\n{content}\n")
 
             # 5. Parse Action / Action Input
             try:
-                action, action_input = self._parse_react_step(content)
+                thought_text, steps = self._parse_react_step(content)
             except ValueError as e:
-                print(f"❌ Parsing failed: {e}")
-                observation =  content
+                log_debug(f"❌ Parsing failed: {e}")
+                # Let the model correct its format on the next turn
+                scratchpad_parts.append(
+                    f"Observation: Invalid response format ({e}). Follow the Response Format exactly.\n"
+                )
+                continue
 
-            thought_match = re.search(r"Thought:\s*(.+?)\s*Action:", content, re.DOTALL)
-            thought_text = thought_match.group(1).strip() if thought_match else ""
             # 6.Check Finish
-            if action.lower() == "finish":
-                final_answer = action_input.get("answer", content)
-                # Record final answer as assistant message
-                self.add_message(Message.assistant(final_answer))
-                print(f"✅ Finish detected. Returning final answer: {final_answer}")
-                return final_answer
-
-            # 7. Tool call
-            print("🛠️ Tool call detected → dispatching tool handler.\n")
-            try:
-                observation = self._handle_tool_call(action, action_input)
-            except (ToolNotFoundError, ToolCallError) as e:
-                print(f"❌ Tool execution error: {e}")
-                observation = str(e)
-
-            # 8. Record observation into scratchpad
-            scratchpad += f"""
-    Thought: {thought_text}
-    Action: {action}
-    Action Input: {json.dumps(action_input)}
-    Observation: {observation}
-    """
+            for action, action_input in steps:
+                if action.lower() == "finish":
+                    final_answer = (
+                        action_input.get("answer", content)
+                        if isinstance(action_input, dict)
+                        else content
+                    )
+                    # Record final answer as assistant message
+                    self.add_message(Message.assistant(final_answer))
+                    if query_embedding is not None:
+                        # Store the steps of this run (the confirmed cached
+                        # plan if no new step was needed)
+                        steps_taken = scratchpad_parts[seeded:]
+                        plan = "\n".join(steps_taken) if steps_taken or cached is None else cached.scratchpad
+                        self.plan_cache.add(
+                            user_input, query_embedding, plan, final_answer,
+                            scope=self._plan_scope,
+                        )
+                    log_debug(f"✅ Finish detected. Returning final answer: {final_answer}")
+                    return final_answer
+
+            # 7. Tool calls (executed concurrently)
+            log_debug(f"🛠️ {len(steps)} tool call(s) detected → dispatching tool handler.\n")
+            observations = self._handle_tool_call(steps)
+
+            # 8. Record observations into scratchpad
+            for (action, action_input), observation in zip(steps, observations):
+                scratchpad_parts.append(
+                    f"Thought: {thought_text}\n"
+                    f"Action: {action}\n"
+                    f"Action Input: {json_utils.dumps(action_input)}\n"
+                    f"Observation: {observation}\n"
+                )
 
         # 9. Max turns reached
-        print("⚠️ Max turns reached. Returning last LLM response.")
-        final_answer = assistant_msg.content or ""
+        log_debug("⚠️ Max turns reached. Returning last LLM response.")
+        final_answer = content
         self.add_message(Message.assistant(final_answer))
 
         return final_answer
@@ -235,43 +440,103 @@ Now produce the NEXT step only.
 
     # ------------ Internal Methods ------------ #
 
-    def _handle_tool_call(self, tool_name: str, params: dict) -> str:
+    @staticmethod
+    def _plan_cache_seed(cached: CachedPlan) -> str:
         """
-        Execute a tool identified by `tool_name` with `params`, then ask the LLM
-        to produce a final answer based on the tool result.
-
-        Args:
-            tool_name: Name of the tool to invoke.
-            params: Parsed parameters (ideally a dict). If params is None or invalid,
-                    a ToolCallError is raised.
-
-        Returns:
-            final_answer (str): The LLM's final answer after tool execution.
-
-        Raises:
-            ToolNotFoundError: If the requested tool is not registered.
-            ToolCallError: If parameters are invalid or tool execution fails.
+        Scratchpad entry replaying a cached plan for a similar question.
         """
-        print(f"⚙️ Handling tool call for `{tool_name}` ...")
+        steps = f"{cached.scratchpad}\n" if cached.scratchpad else ""
+        return (
+            f"{steps}"
+            f"Observation: These steps answered a similar question ({cached.query!r}) "
+            f"with: {cached.answer}. If they also answer the current question, "
+            "Finish with the answer adapted to it; otherwise continue.\n"
+        )
 
-        # Validate tool existence
-        if tool_name not in self.tool_by_names:
-            print("❌ Tool not found!")
-            raise ToolNotFoundError(f"Unknown tool: {tool_name}")
+    def _stream_until_action_input(self) -> str:
+        """
+        Stream the next reply and return it as soon as its step is complete.
 
-        tool = self.tool_by_names[tool_name]
+        The step is complete once an Action Input JSON value is closed and the
+        next non-empty line does not start another Action (models often go on
+        to invent an Observation). The stream is then closed, so the tool call
+        is not held back by tokens that would be discarded anyway.
 
-        # Execute tool function and capture any runtime errors.
-        print(f"🔧 Executing tool `{tool_name}` with params: {params}")
+        Returns:
+            The reply text, cut right after the last complete Action Input.
+        """
+        response = self.llm.generate(self._sync_serialized_history(), stream=True)
+        marker = "Action Input:"
+        text = ""
+        search_from = 0  # where the next `Action Input:` marker may start
+        scanner: Optional[_JsonValueScanner] = None  # set once a marker is found
+        end: Optional[int] = None  # index just past the closed Action Input value
         try:
-            start = time.perf_counter()
-            result = tool(**params)
-            print(f"📦 Tool result: {result} | ⏱️ Cost: {time.perf_counter() - start: .1f}s")
-            return result
-        except Exception as e:
-            print(f"💥 Tool execution failed: {e}")
-            raise ToolCallError(f"Tool execution failed: {e}")
+            for chunk in response:
+                text += chunk
+
+                # Each chunk is scanned once: the marker search and the JSON
+                # scanner both resume where they stopped
+                while True:
+                    if end is None:
+                        if scanner is None:
+                            found = text.find(marker, search_from)
+                            if found < 0:
+                                # The marker may straddle the next chunk
+                                search_from = max(search_from, len(text) - len(marker) + 1)
+                                break
+                            scanner = _JsonValueScanner(found + len(marker))
+
+                        end = scanner.feed(text)
+                        if end is None:
+                            if scanner.invalid:
+                                # Not a JSON value: look for the next marker
+                                search_from, scanner = scanner.pos, None
+                                continue
+                            break
+
+                    rest = text[end:].lstrip()
+                    if not rest:
+                        break
+                    next_line = rest.split("\n", 1)[0]
+                    if next_line.startswith("Action:"):
+                        # Another Action follows: wait for its input
+                        search_from, scanner, end = end, None, None
+                        continue
+                    if "Action:".startswith(next_line):
+                        # The line is still partial
+                        break
+
+                    log_debug("✂️ Action Input complete → closing the stream early.")
+                    return text[:end]
+        finally:
+            response.close()
+
+        return text
+
+    def close(self) -> None:
+        """Shut down the tool executor."""
+        self._tool_executor.close()
+
+    def _handle_tool_call(self, calls: List[Tuple[str, Any]]) -> List[str]:
+        """
+        Execute the tool calls of one step concurrently.
 
+        Args:
+            calls: (tool_name, params) pairs parsed from the model output.
 
-        
-      
+        Returns:
+            observations (List[str]): One observation per call, in the same order
+                as `calls`. A failed call (unknown tool, invalid parameters or a
+                runtime error) yields the error message instead of a result.
+        """
+        log_debug(f"⚙️ Handling tool calls: {[name for name, _ in calls]} ...")
+
+        observations = []
+        for (tool_name, _), result in zip(
+            calls, self._tool_executor.execute(self.tool_by_names, calls)
+        ):
+            if isinstance(result, (ToolNotFoundError, ToolCallError)):
+                log_debug(f"❌ Tool `{tool_name}` error: {result}")
+            observations.append(str(result))
+        return observations
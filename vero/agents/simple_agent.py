@@ -1,14 +1,13 @@
 import re
-import ast
-import json
-import time
 
-from typing import List, Optional, Tuple, Dict
+from typing import Any, List, Optional, Tuple, Dict
 
-from vero.tool import Tool
+from vero.tool import Tool, ParallelToolExecutor
 from vero.core.message import Message
 from vero.core.chat_openai import ChatOpenAI
 from vero.core.agent import Agent
+from vero.core.debug import log_debug
+from vero.core import json_utils
 from vero.core.exceptions import ToolNotFoundError, ToolCallError
 
 
@@ -25,11 +24,13 @@ class SimpleAgent(Agent):
     Behavior:
         1. Append the user message to the conversation history.
         2. Ask the LLM for a reply.
-        3. If the LLM outputs a TOOL_CALL, parse and execute the tool.
-        4. Inject the tool result into conversation history and ask the LLM again to produce the final answer.
+        3. If the LLM outputs TOOL_CALL lines, parse them and execute the tools concurrently.
+        4. Inject the tool results into conversation history and ask the LLM again to produce the final answer.
     """
 
     TOOL_CALL_PATTERN = r"TOOL_CALL:(\w+):(.+)"
+    # Compiled once at class load instead of on every parsed reply
+    TOOL_CALL_RE = re.compile(TOOL_CALL_PATTERN)
 
     DEFAULT_PROMPT_WITHOUT_TOOLS = (
         "You are a helpful and intelligent AI assistant. Answer the user concisely and accurately."
@@ -46,11 +47,18 @@ When you decide that using a tool is necessary:
 - Use the exact format:
   TOOL_CALL:tool_name:{{"param1": 1, "param2": "abc"}}
 - The parameters must be a valid JSON object that includes all required arguments of the tool.
+- To call several tools at once, write one TOOL_CALL line per call.
 - If no tool is needed, simply respond with normal text.
 
 Follow the format strictly. Do not explain the tool call. Do not wrap the tool call in code blocks.
 """
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # A subclass overriding only the pattern string gets it compiled too
+        if "TOOL_CALL_PATTERN" in cls.__dict__ and "TOOL_CALL_RE" not in cls.__dict__:
+            cls.TOOL_CALL_RE = re.compile(cls.TOOL_CALL_PATTERN)
+
     def __init__(
         self,
         name: str,
@@ -58,6 +66,7 @@ Follow the format strictly. Do not explain the tool call. Do not wrap the tool c
         tools: Optional[List[Tool]] = None,
         system_prompt: Optional[str] = None,
         max_turns: int = 3,
+        max_tool_concurrency: Optional[int] = None,
     ) -> None:
         """
         Initialize SimpleAgent.
@@ -69,19 +78,23 @@ Follow the format strictly. Do not explain the tool call. Do not wrap the tool c
             system_prompt: Optional system prompt override. If omitted, a prompt
                            is generated from the provided tools.
             max_turns: Reserved for future use (e.g., limit recursive tool calls).
+            max_tool_concurrency: Maximum number of tool calls executed in parallel
+                           (defaults to settings.tool_concurrency).
         """
-        print(f"🚀 Initializing SimpleAgent `{name}` ...")
+        log_debug(f"🚀 Initializing SimpleAgent `{name}` ...")
 
         super().__init__(name=name, llm=llm, tools=tools, system_prompt=system_prompt, max_turns=max_turns)
 
+        self._tool_executor = ParallelToolExecutor(max_tool_concurrency)
+
         # Ensure there is a system prompt at the beginning of the conversation history.
         if self.system_prompt:
             sp = self.system_prompt
-            print("📝 Using provided system prompt.")
+            log_debug("📝 Using provided system prompt.")
 
         else:
             sp = self._build_system_prompt()
-            print("🛠️ Generated system prompt from tool list.")
+            log_debug("🛠️ Generated system prompt from tool list.")
 
 
         # Use the base class API to append the initial system message.
@@ -93,46 +106,72 @@ Follow the format strictly. Do not explain the tool call. Do not wrap the tool c
             return self.DEFAULT_PROMPT_WITHOUT_TOOLS
         return self.DEFAULT_PROMPT_WITH_TOOLS.format(tool_descriptions=self.tool_descriptions)
 
-    def _parse_tool_call(self, text: str) -> Tuple[bool, Optional[str], Optional[Dict]]:
+    def _parse_tool_call(self, text: str) -> List[Tuple[str, Optional[Dict]]]:
         """
-        Detect and parse a TOOL_CALL from model output.
+        Detect and parse the TOOL_CALL lines in model output.
 
         Returns:
-            (has_call, tool_name, params_dict_or_None)
+            List of (tool_name, params_dict_or_None), one per TOOL_CALL line,
+            in order. Empty if no tool call was requested.
 
         Notes:
-            - This tries JSON parsing first (preferred), then falls back to
-              Python literal parsing (`ast.literal_eval`) to accept dict-like
-              representations produced by some models.
+            - Parameters are parsed by `_parse_params`: JSON first (preferred),
+              then fallbacks accepting the Python dict-like representations
+              produced by some models.
             - If parsing fails, params will be None.
         """
-        print("🔍 Parsing model output for TOOL_CALL ...")
+        log_debug("🔍 Parsing model output for TOOL_CALL ...")
+
+        calls = []
+        for match in self.TOOL_CALL_RE.finditer(text):
+            tool_name = match.group(1)
+            params_str = match.group(2).strip()
+
+            log_debug(f"🧩 TOOL_CALL detected → tool: `{tool_name}`, raw params: {params_str}")
 
-        match = re.search(self.TOOL_CALL_PATTERN, text)
-        if not match:
-            print("❌ No TOOL_CALL detected.")
-            return False, None, None
+            calls.append((tool_name, self._parse_params(params_str)))
 
-        tool_name = match.group(1)
-        params_str = match.group(2).strip()
+        if not calls:
+            log_debug("❌ No TOOL_CALL detected.")
 
-        print(f"🧩 TOOL_CALL detected → tool: `{tool_name}`, raw params: {params_str}")
+        return calls
 
-        # Attempt to parse parameters into a dict.
-        params = None
+    @staticmethod
+    def _parse_params(params_str: str) -> Optional[Any]:
+        """
+        Parse TOOL_CALL parameters, returning None if they cannot be parsed.
+
+        Tries, in order:
+            1. JSON (the requested format).
+            2. JSON after swapping single quotes for double quotes, which covers
+               the common Python-repr style ({'a': 'b'}).
+            3. `ast.literal_eval`, imported lazily since it runs the Python
+               parser and is rarely needed.
+        """
         try:
-            params = json.loads(params_str)
-            print("📦 Parameters parsed via JSON.")
+            params = json_utils.loads(params_str)
+            log_debug("📦 Parameters parsed via JSON.")
+            return params
+        except json_utils.JSONDecodeError:
+            pass
 
-        except Exception:
+        if "'" in params_str:
             try:
-                params = ast.literal_eval(params_str)
-                print("📦 Parameters parsed via Python literal_eval.")
-            except Exception:
-                print("❌ Failed to parse parameters.")
-                params = None
+                params = json_utils.loads(params_str.replace("'", '"'))
+                log_debug("📦 Parameters parsed via JSON after quote normalization.")
+                return params
+            except json_utils.JSONDecodeError:
+                pass
 
-        return True, tool_name, params
+        import ast
+
+        try:
+            params = ast.literal_eval(params_str)
+            log_debug("📦 Parameters parsed via Python literal_eval.")
+            return params
+        except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+            log_debug("❌ Failed to parse parameters.")
+            return None
 
     def run(self, user_input: str) -> str:
         """
@@ -144,83 +183,70 @@ Follow the format strictly. Do not explain the tool call. Do not wrap the tool c
             3. If the reply requests a tool call, execute it and feed the result back into history.
             4. Return the final LLM answer (either the first reply if no tool used, or the post-tool final reply).
         """
-        print(f"\n==============================")
-        print(f"👤 User Input: {user_input}")
-        print("==============================\n")
+        log_debug(f"\n==============================")
+        log_debug(f"👤 User Input: {user_input}")
+        log_debug("==============================\n")
         # 1) append user input
         self.add_message(Message.user(user_input))
 
-        # 2) ask LLM for reply (llm.generate accepts the history of Message objects)
-        assistant_msg: Message = self.llm.generate(self._history)
-        print(f"📤 LLM Assistant Message: {assistant_msg.content}\n")
+        # 2) ask LLM for reply (history is sent in wire format, serialized once per message)
+        assistant_msg: Message = self.llm.generate(self._sync_serialized_history())
+        log_debug(f"📤 LLM Assistant Message: {assistant_msg.content}\n")
 
         # record assistant's raw reply
         self.add_message(assistant_msg)
 
         # 3) parse for a tool call
         content = assistant_msg.content or ""
-        has_call, tool_name, params = self._parse_tool_call(content)
+        calls = self._parse_tool_call(content)
 
-        if has_call:
-            print("🛠️ Tool call detected → dispatching tool handler.\n")
-            return self._handle_tool_call(tool_name, params)
+        if calls:
+            log_debug(f"🛠️ {len(calls)} tool call(s) detected → dispatching tool handler.\n")
+            return self._handle_tool_call(calls)
 
         # no tool requested → return the assistant reply directly
-        print("💬 No tool requested → returning LLM reply.\n")
+        log_debug("💬 No tool requested → returning LLM reply.\n")
         return content
 
     # ------------ Internal Methods ------------ #
 
-    def _handle_tool_call(self, tool_name: str, params: dict) -> str:
+    def close(self) -> None:
+        """Shut down the tool executor."""
+        self._tool_executor.close()
+
+    def _handle_tool_call(self, calls: List[Tuple[str, Any]]) -> str:
         """
-        Execute a tool identified by `tool_name` with `params`, then ask the LLM
-        to produce a final answer based on the tool result.
+        Execute the requested tools concurrently, then ask the LLM to produce a
+        final answer based on the tool results.
 
         Args:
-            tool_name: Name of the tool to invoke.
-            params: Parsed parameters (ideally a dict). If params is None or invalid,
-                    a ToolCallError is raised.
+            calls: (tool_name, params) pairs parsed from the model output.
 
         Returns:
             final_answer (str): The LLM's final answer after tool execution.
 
-        Raises:
-            ToolNotFoundError: If the requested tool is not registered.
-            ToolCallError: If parameters are invalid or tool execution fails.
+        Notes:
+            A failed call (unknown tool, invalid parameters or a runtime error)
+            does not abort the others; its error message is reported to the
+            model as that call's result.
         """
-        print(f"⚙️ Handling tool call for `{tool_name}` ...")
+        log_debug(f"⚙️ Handling tool calls: {[name for name, _ in calls]} ...")
 
-        # Validate tool existence
-        if tool_name not in self.tool_by_names:
-            print("❌ Tool not found!")
-            raise ToolNotFoundError(f"Unknown tool: {tool_name}")
+        results = self._tool_executor.execute(self.tool_by_names, calls)
 
-        if not isinstance(params, dict):
-            print("❌ Invalid parameter format!")
-            raise ToolCallError("Tool parameters must be provided as an object/dict.")
-
-        tool = self.tool_by_names[tool_name]
-
-        # Execute tool function and capture any runtime errors.
-        print(f"🔧 Executing tool `{tool_name}` with params: {params}")
-        try:
-            start = time.perf_counter()
-            result = tool(**params)
-            print(f"📦 Tool result: {result} | ⏱️ Cost: {time.perf_counter() - start: .1f}s")
-        except Exception as e:
-            print(f"💥 Tool execution failed: {e}")
-            raise ToolCallError(f"Tool execution failed: {e}")
-        
-        print("📥 Adding TOOL_RESULT message to history.")
-        # Inject tool result back into the conversation.
+        log_debug("📥 Adding TOOL_RESULT messages to history.")
+        # Inject tool results back into the conversation, in call order.
         # NOTE: we use a user-style message ("TOOL_RESULT:...") to make it explicit
         # in the history that this is external evidence for the model to consume.
         # This keeps assistant-generated messages separate from tool outputs and
         # makes it easier to craft follow-up prompts like "Please answer the user using this tool result."
-        self.add_message(Message.user(f"TOOL_RESULT:{result}"))
+        for (tool_name, _), result in zip(calls, results):
+            if isinstance(result, (ToolNotFoundError, ToolCallError)):
+                log_debug(f"❌ Tool `{tool_name}` error: {result}")
+            self.add_message(Message.user(f"TOOL_RESULT:{tool_name}:{result}"))
 
         # Ask LLM for final answer
-        final_msg: Message = self.llm.generate(self._history)
+        final_msg: Message = self.llm.generate(self._sync_serialized_history())
         self.add_message(final_msg)
 
         return final_msg.content or ""
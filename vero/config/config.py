@@ -7,6 +7,8 @@ class Settings(BaseSettings):
     timeout: int = 60
     model_name: str = "Qwen/Qwen3-32B"
     temperature: float = 0.7
+    tool_concurrency: int = 4
+    plan_cache_enabled: bool = False
 
     model_config = SettingsConfigDict(
         env_file=".env",
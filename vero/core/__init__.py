@@ -1,4 +1,5 @@
 from .message import Message
+from .debug import log_debug, sync_debug_level
 from .exceptions import (
     VeroException,
     LLMCallError,
@@ -10,7 +11,10 @@ from .exceptions import (
     ToolCallError,
     ToolNotFoundError
 )
-from .chat_openai import ChatOpenAI
+from .llm_cache import LLMCache, MemoryBackend, DiskBackend
+from .stream_buffer import StreamBuffer
+from .plan_cache import PlanCache, CachedPlan
+from .chat_openai import ChatOpenAI, StreamingResponse
 from .agent import Agent
 
 
@@ -18,6 +22,13 @@ from .agent import Agent
 __all__ = [
     "Message",
     "ChatOpenAI",
+    "StreamingResponse",
+    "StreamBuffer",
+    "LLMCache",
+    "MemoryBackend",
+    "DiskBackend",
+    "PlanCache",
+    "CachedPlan",
     "VeroException",
     "LLMCallError",
     "LLMConfigError",
@@ -27,6 +38,8 @@ __all__ = [
     "ToolError",
     "ToolCallError",
     "ToolNotFoundError",
-    "Agent"
+    "Agent",
+    "log_debug",
+    "sync_debug_level"
 ]
 
@@ -1,5 +1,8 @@
+import copy
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Union
 
 from vero.tool import Tool
 from .message import Message
@@ -43,11 +46,22 @@ class Agent(ABC):
         self.llm = llm
         self.tools = tools or []
         self.max_turns = max_turns
+
+        # Tool metadata, built once (tools are fixed after construction)
+        self._tool_by_names: dict[str, Tool] = {tool.name: tool for tool in self.tools}
+        self._tool_descriptions = "\n".join(tool.to_string() for tool in self.tools)
+        self._tool_names = ",".join(tool.name for tool in self.tools)
         self.system_prompt = system_prompt
 
         # Internal conversation history (Message objects)
         self._history: List[Message] = []
 
+        # Wire-format copy of the history, serialized once per message as it is
+        # added so each LLM call does not re-serialize the whole conversation.
+        # It may lag behind `_history` at the tail (see `add_final_message`);
+        # `_sync_serialized_history` catches it up before the next request.
+        self._serialized_history: List[dict] = []
+
     # -------------------------------------------------------
     # Abstract API
     # -------------------------------------------------------
@@ -70,6 +84,84 @@ class Agent(ABC):
         """
         pass
 
+    async def arun(self, input_text: str, **kwargs) -> str:
+        """
+        Async variant of `run`.
+
+        The default implementation runs `run` in a worker thread; agents with a
+        native async loop (e.g. OpenAIFunctionAgent) override it.
+        """
+        return await asyncio.to_thread(self.run, input_text, **kwargs)
+
+    # -------------------------------------------------------
+    # Batch execution
+    # -------------------------------------------------------
+    def run_batch(self, queries: List[str], max_concurrency: int = 8) -> List[str]:
+        """
+        Run several independent queries concurrently.
+
+        Each query runs on its own fork of this agent (sharing the LLM client and
+        tools, with a private copy of the current history), so traces do not
+        interfere with each other or with this agent's history. Agent runs are
+        dominated by network latency, so threads overlap them well.
+
+        Args:
+            queries (List[str]): User inputs, one trace per entry.
+            max_concurrency (int): Maximum number of traces running at once.
+
+        Returns:
+            List[str]: Final answers, in the same order as `queries`.
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            return list(pool.map(lambda q: self._fork().run(q), queries))
+
+    async def run_batch_async(
+        self, queries: List[str], max_concurrency: int = 8
+    ) -> List[str]:
+        """
+        Async counterpart of `run_batch`, for callers already inside an event loop.
+
+        Args:
+            queries (List[str]): User inputs, one trace per entry.
+            max_concurrency (int): Maximum number of traces running at once.
+
+        Returns:
+            List[str]: Final answers, in the same order as `queries`.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run_one(query: str) -> str:
+            async with semaphore:
+                return await self._fork().arun(query)
+
+        return list(await asyncio.gather(*(_run_one(q) for q in queries)))
+
+    def _fork(self) -> "Agent":
+        """
+        Return a shallow clone with its own copy of the conversation history.
+        """
+        clone = copy.copy(self)
+        clone._history = [m.model_copy() for m in self._history]
+        clone._serialized_history = list(self._serialized_history)
+        return clone
+
+    # -------------------------------------------------------
+    # Resource management
+    # -------------------------------------------------------
+    def close(self) -> None:
+        """
+        Release resources held by the agent (e.g. tool worker threads).
+
+        Forks made by `run_batch` share these resources with this agent, so
+        only the original agent should be closed.
+        """
+
+    def __enter__(self) -> "Agent":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     # -------------------------------------------------------
     # Tool metadata helpers
     # -------------------------------------------------------
@@ -81,25 +173,25 @@ class Agent(ABC):
         Format example:
             calculate_sum(a: int, b: int) - Add two numbers
             search_web(query: str) - Search the internet
+
+        Built once at construction time.
         """
-        lines = []
-        for tool in self.tools:
-            args_text = ", ".join(f"{name}: {typ}" for (name, typ, *_rest) in tool.arguments)
-            lines.append(f"{tool.name}({args_text}) - {tool.description}")
-        return "\n".join(lines)
+        return self._tool_descriptions
 
     @property
     def tool_names(self) -> str:
-        """Return a comma-separated list of tool names."""
-        return ",".join([tool.name for tool in self.tools])
+        """Return a comma-separated list of tool names (built once at construction time)."""
+        return self._tool_names
 
     @property
     def tool_by_names(self) -> dict[str, Tool]:
         """
         Return a dictionary mapping tool_name → Tool instance.
         Useful for subclasses implementing custom tool-invocation logic.
+
+        Built once at construction time; treat it as read-only.
         """
-        return {tool.name: tool for tool in self.tools}
+        return self._tool_by_names
 
     # -------------------------------------------------------
     # Conversation memory
@@ -107,10 +199,46 @@ class Agent(ABC):
     def add_message(self, message: Message) -> None:
         """Append a message to the conversation history."""
         self._history.append(message)
+        self._sync_serialized_history()
+
+    def add_final_message(self, message: Message) -> None:
+        """
+        Append the final message of a run without serializing it.
+
+        The message is only sent to the LLM if the conversation continues, so
+        its wire format is produced lazily by `_sync_serialized_history`.
+        """
+        self._history.append(message)
+
+    def _sync_serialized_history(self) -> List[dict]:
+        """Serialize any messages not yet in the wire-format history."""
+        serialized = self._serialized_history
+        for message in self._history[len(serialized):]:
+            serialized.append(message.to_dict())
+        return serialized
 
     def clear_history(self) -> None:
         """Clear all stored conversation history."""
         self._history.clear()
+        self._serialized_history.clear()
+
+    def _set_system_message(self, content: Union[str, List[dict]]) -> None:
+        """
+        Replace the content of the leading system message (inserting one if absent),
+        keeping the serialized history in sync.
+        """
+        self._sync_serialized_history()
+        if self._history and self._history[0].role == "system":
+            # Plain field assignment (Message does not validate on assignment);
+            # only the content changes, so the wire dict is patched rather
+            # than rebuilt with to_dict(). A new dict is stored because earlier
+            # requests may still reference the previous one.
+            self._history[0].content = content
+            self._serialized_history[0] = {**self._serialized_history[0], "content": content}
+        else:
+            message = Message.system(content)
+            self._history.insert(0, message)
+            self._serialized_history.insert(0, message.to_dict())
 
     # -------------------------------------------------------
     # Representation
@@ -0,0 +1,49 @@
+import sys
+import logging
+
+from vero.config import settings
+
+
+# Root of the framework's logger hierarchy; module loggers such as
+# "vero.agent" are its children, so `settings.debug` controls all of them.
+logger = logging.getLogger("vero")
+
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(logging.Formatter("%(message)s"))
+
+_applied_debug = None
+
+
+def sync_debug_level() -> None:
+    """
+    Apply `settings.debug` to the `vero` logger.
+
+    When debug is on the level is DEBUG and records are printed to stdout;
+    when it is off the level is WARNING and no handler is attached, so only
+    warnings reach Python's default (or the application's) handlers.
+    """
+    global _applied_debug
+    if settings.debug == _applied_debug:
+        return
+
+    _applied_debug = settings.debug
+    if settings.debug:
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(_handler)
+    else:
+        logger.setLevel(logging.WARNING)
+        logger.removeHandler(_handler)
+
+
+def log_debug(message: str) -> None:
+    """
+    Log progress output at DEBUG level on the `vero` logger.
+
+    Only shown when `settings.debug` is enabled. The message is still built by
+    the caller, so guard expensive messages with `if settings.debug:` as well.
+    """
+    sync_debug_level()
+    logger.debug(message)
+
+
+sync_debug_level()
@@ -0,0 +1,42 @@
+"""
+JSON helpers for hot paths (tool arguments, cache keys, scratchpads).
+
+Uses `orjson` when it is installed (`pip install vero[fast]`) and falls back
+to the standard library otherwise. Both backends raise a subclass of
+`json.JSONDecodeError` on invalid input.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    Serialize `obj` to UTF-8 encoded JSON bytes. Unsupported values are
+    converted with `str()`.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, sort_keys=sort_keys, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> str:
+    """Serialize `obj` to a JSON string."""
+    return dumps_bytes(obj, sort_keys=sort_keys).decode("utf-8")
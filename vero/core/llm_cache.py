@@ -0,0 +1,138 @@
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from . import json_utils
+
+
+class MemoryBackend:
+    """
+    Thread-safe in-memory LRU store with optional per-entry expiry.
+
+    Attributes:
+        maxsize: Maximum number of entries kept before the least recently
+                 used one is evicted.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the stored value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            value, deadline = entry
+            if deadline is not None and deadline < time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, expire: Optional[float] = None) -> None:
+        """Store a value, evicting the oldest entry when full."""
+        deadline = time.monotonic() + expire if expire is not None else None
+        with self._lock:
+            self._data[key] = (value, deadline)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskBackend:
+    """
+    Persistent store backed by `diskcache`, useful to keep responses across
+    development runs. Requires the optional `diskcache` package.
+    """
+
+    def __init__(self, directory: str = ".vero_cache") -> None:
+        try:
+            import diskcache
+        except ImportError as e:
+            raise ImportError(
+                "DiskBackend requires `diskcache`. Install it with `pip install diskcache`."
+            ) from e
+
+        self._cache = diskcache.Cache(directory)
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: Any, expire: Optional[float] = None) -> None:
+        self._cache.set(key, value, expire=expire)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class LLMCache:
+    """
+    Response-level cache for `ChatOpenAI.generate`.
+
+    Requests are keyed by a SHA-256 hash of the full request payload
+    (model, messages, tools, tool_choice, temperature, ...). Only
+    deterministic calls (temperature == 0) are cached, since sampling at a
+    higher temperature is expected to produce different answers.
+
+    Attributes:
+        backend: Storage backend (MemoryBackend by default).
+        ttl: Optional lifetime of an entry in seconds.
+        enabled: Global switch; when False every lookup is a miss.
+        stats: Hit / miss counters for observability.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[Any] = None,
+        ttl: Optional[float] = None,
+        enabled: bool = True,
+    ) -> None:
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttl = ttl
+        self.enabled = enabled
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        # Agent forks (run_batch) share one cache across threads
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def cache_key(payload: Dict[str, Any]) -> str:
+        """
+        Build a stable key for a chat completion request payload.
+        """
+        return hashlib.sha256(json_utils.dumps_bytes(payload, sort_keys=True)).hexdigest()
+
+    def is_cacheable(self, payload: Dict[str, Any]) -> bool:
+        """Only deterministic (temperature == 0) requests are cached."""
+        return self.enabled and payload.get("temperature") == 0
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.backend.get(key)
+        counter = "misses" if value is None else "hits"
+        with self._stats_lock:
+            self.stats[counter] += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self.backend.set(key, value, expire=self.ttl)
+
+    def clear(self) -> None:
+        self.backend.clear()
+        with self._stats_lock:
+            self.stats = {"hits": 0, "misses": 0}
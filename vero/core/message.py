@@ -1,35 +1,104 @@
-from typing import Dict, Any, Optional, List, Self, Union, Literal
+from typing import Dict, Any, Optional, List, Self, Union
 import time
-from pydantic import BaseModel, Field
+from datetime import datetime
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+
+def _now_seconds() -> int:
+    """Current Unix time in whole seconds (no float or datetime allocation)."""
+    return time.time_ns() // 1_000_000_000
+
+
+# Fields sent to the model, in wire order (timestamp/metadata are local only)
+_DUMP_FIELDS = ("content", "role", "name", "tool_call_id", "tool_calls")
+
+_VALID_ROLES = frozenset({"system", "user", "assistant", "tool"})
 
 
 class Message(BaseModel):
     content: Optional[Union[str, List[Dict[str, Any]]]] = None
-    role: Literal["system", "user", "assistant", "tool"]
+    role: str
     name: Optional[str] = None
     tool_call_id: Optional[str] = None
     tool_calls: Optional[List[Dict[str, Any]]] = None
-    timestamp: int = Field(default_factory=lambda: int(time.time()))
+    timestamp: int = Field(default_factory=_now_seconds)
     metadata: Dict[str, Any] = Field(
         default_factory=dict, description="token counts"
     )
 
+    # Memoized result of to_dict(), reset whenever a field is assigned
+    _cached_dict: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    @field_validator("role")
+    @classmethod
+    def _check_role(cls, role: str) -> str:
+        # Only runs on validated construction (external data); the internal
+        # constructors pass known roles through model_construct
+        if role not in _VALID_ROLES:
+            raise ValueError(f"role must be one of {sorted(_VALID_ROLES)}, got {role!r}")
+        return role
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != "_cached_dict":
+            self._cached_dict = None
+
+    def __eq__(self, other: Any) -> bool:
+        # Compare fields only; pydantic would also compare the private cache
+        if not isinstance(other, Message):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    @property
+    def datetime_timestamp(self) -> datetime:
+        """Creation time as a local `datetime`, built on demand."""
+        return datetime.fromtimestamp(self.timestamp)
+
+    # Internal constructors: content comes from typed Python values inside the
+    # library (or from already-validated SDK objects), so validation is skipped
+    # with `model_construct`. Use the `validated_*` variants for untrusted data.
+
     @classmethod
     def user(cls, content: str, **kw) -> Self:
-        return cls(role="user", content=content, **kw)
+        return cls.model_construct(role="user", content=content, **kw)
 
     @classmethod
     def system(cls, content: str, **kw) -> Self:
-        return cls(role="system", content=content, **kw)
+        return cls.model_construct(role="system", content=content, **kw)
 
     @classmethod
     def assistant(
         cls, content: Optional[str] = None, tool_calls: List[dict] = None, **kw
     ) -> Self:
-        return cls(role="assistant", content=content, tool_calls=tool_calls, **kw)
+        return cls.model_construct(
+            role="assistant", content=content, tool_calls=tool_calls, **kw
+        )
 
     @classmethod
     def tool(cls, content: str, tool_call_id: str, **kw) -> Self:
+        return cls.model_construct(
+            role="tool",
+            content=content,
+            tool_call_id=tool_call_id,
+            **kw,
+        )
+
+    @classmethod
+    def validated_user(cls, content: str, **kw) -> Self:
+        return cls(role="user", content=content, **kw)
+
+    @classmethod
+    def validated_system(cls, content: str, **kw) -> Self:
+        return cls(role="system", content=content, **kw)
+
+    @classmethod
+    def validated_assistant(
+        cls, content: Optional[str] = None, tool_calls: List[dict] = None, **kw
+    ) -> Self:
+        return cls(role="assistant", content=content, tool_calls=tool_calls, **kw)
+
+    @classmethod
+    def validated_tool(cls, content: str, tool_call_id: str, **kw) -> Self:
         return cls(
             role="tool",
             content=content,
@@ -38,10 +107,21 @@ class Message(BaseModel):
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        d = {
-            k: v
-            for k, v in self.__dict__.items()
-            if k not in ("timestamp", "metadata") and v is not None
-        }
+        """
+        Wire-format dict (no timestamp/metadata, None fields dropped).
+
+        The dict is built once and reused until a field is reassigned; treat
+        it as read-only. In-place changes to nested values (e.g. appending
+        to `tool_calls`) are not tracked.
+        """
+        d = self._cached_dict
+        if d is None:
+            fields = self.__dict__
+            d = {}
+            for k in _DUMP_FIELDS:
+                v = fields[k]
+                if v is not None:
+                    d[k] = v
+            self._cached_dict = d
 
         return d
\ No newline at end of file
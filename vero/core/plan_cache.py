@@ -0,0 +1,192 @@
+import math
+import time
+import sqlite3
+import threading
+from array import array
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+
+
+@dataclass
+class CachedPlan:
+    """
+    A completed agent trajectory stored in the PlanCache.
+
+    Attributes:
+        query: The user input that produced the plan.
+        scratchpad: The reasoning steps taken (Thought / Action / Observation).
+        answer: The final answer.
+        similarity: Cosine similarity to the looked-up query (set on lookup).
+    """
+
+    query: str
+    scratchpad: str
+    answer: str
+    similarity: float = 1.0
+
+
+def _normalize(vector: Sequence[float]) -> array:
+    """Return `vector` scaled to unit length, as a float32 array."""
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return array("f", (x / norm for x in vector))
+
+
+class PlanCache:
+    """
+    Semantic cache of completed agent runs, keyed by query embedding.
+
+    Queries are embedded and L2-normalized; a lookup returns the stored plan
+    whose query has the highest cosine similarity, if it reaches `threshold`.
+    Plans are kept in a SQLite database (in memory by default) and in memory
+    for search.
+
+    Every plan belongs to a `scope` (e.g. a hash of an agent's tools and
+    system prompt), so agents configured differently never see each other's
+    plans. Entries older than `ttl` seconds are ignored.
+
+    Attributes:
+        path: SQLite database file (":memory:" for a process-local cache).
+        threshold: Minimum cosine similarity for a hit.
+        ttl: Optional lifetime of an entry in seconds.
+    """
+
+    DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        embedder: Optional[Callable[[str], Sequence[float]]] = None,
+        threshold: float = 0.92,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            path: SQLite database file; pass a file path to keep plans across
+                runs.
+            embedder: Function mapping a text to an embedding vector. Defaults
+                to a local sentence-transformers model (requires the optional
+                `sentence-transformers` package).
+            threshold: Minimum cosine similarity for a hit.
+            ttl: Optional lifetime of an entry in seconds.
+        """
+        self.path = path
+        self.threshold = threshold
+        self.ttl = ttl
+        self._embedder = embedder
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS plans ("
+            "id INTEGER PRIMARY KEY, scope TEXT, created_at REAL, query TEXT, "
+            "embedding BLOB, scratchpad TEXT, answer TEXT)"
+        )
+        self._conn.commit()
+
+        # Parallel lists, one entry per stored plan
+        self._vectors: List[array] = []
+        self._plans: List[CachedPlan] = []
+        self._scopes: List[str] = []
+        self._created: List[float] = []
+        for scope, created_at, query, blob, scratchpad, answer in self._conn.execute(
+            "SELECT scope, created_at, query, embedding, scratchpad, answer "
+            "FROM plans ORDER BY id"
+        ):
+            vector = array("f")
+            vector.frombytes(blob)
+            self._vectors.append(vector)
+            self._plans.append(CachedPlan(query, scratchpad, answer))
+            self._scopes.append(scope)
+            self._created.append(created_at)
+
+    def embed(self, text: str) -> array:
+        """
+        Return the normalized embedding of `text`.
+        """
+        if self._embedder is None:
+            self._embedder = self._load_default_embedder()
+        return _normalize(self._embedder(text))
+
+    def lookup(self, embedding: Sequence[float], scope: str = "") -> Optional[CachedPlan]:
+        """
+        Return the most similar stored plan, or None if none reaches the threshold.
+
+        Args:
+            embedding: Normalized query embedding (see `embed`).
+            scope: Only plans stored under the same scope are considered.
+        """
+        oldest = time.time() - self.ttl if self.ttl is not None else None
+        best_score, best_idx = -1.0, -1
+        with self._lock:
+            for idx, vector in enumerate(self._vectors):
+                if self._scopes[idx] != scope:
+                    continue
+                if oldest is not None and self._created[idx] < oldest:
+                    continue
+                score = sum(a * b for a, b in zip(vector, embedding))
+                if score > best_score:
+                    best_score, best_idx = score, idx
+
+            if best_idx < 0 or best_score < self.threshold:
+                return None
+
+            plan = self._plans[best_idx]
+
+        return CachedPlan(plan.query, plan.scratchpad, plan.answer, best_score)
+
+    def add(
+        self,
+        query: str,
+        embedding: Sequence[float],
+        scratchpad: str,
+        answer: str,
+        scope: str = "",
+    ) -> None:
+        """
+        Store a completed plan.
+
+        Args:
+            query: The user input.
+            embedding: Normalized query embedding (see `embed`).
+            scratchpad: The reasoning steps taken.
+            answer: The final answer.
+            scope: Scope the plan is stored under (see `lookup`).
+        """
+        vector = array("f", embedding)
+        created_at = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO plans (scope, created_at, query, embedding, scratchpad, answer) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (scope, created_at, query, vector.tobytes(), scratchpad, answer),
+            )
+            self._conn.commit()
+            self._vectors.append(vector)
+            self._plans.append(CachedPlan(query, scratchpad, answer))
+            self._scopes.append(scope)
+            self._created.append(created_at)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM plans")
+            self._conn.commit()
+            self._vectors.clear()
+            self._plans.clear()
+            self._scopes.clear()
+            self._created.clear()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    @classmethod
+    def _load_default_embedder(cls) -> Callable[[str], Sequence[float]]:
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "PlanCache requires `sentence-transformers` unless an `embedder` is given. "
+                "Install it with `pip install sentence-transformers`."
+            ) from e
+
+        model = SentenceTransformer(cls.DEFAULT_MODEL)
+        return lambda text: model.encode(text).tolist()
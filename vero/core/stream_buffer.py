@@ -0,0 +1,62 @@
+import time
+from typing import List, Optional
+
+
+class StreamBuffer:
+    """
+    Coalesce small streamed text deltas into larger chunks.
+
+    Streaming APIs emit one delta per token or two, so consumers pay Python
+    dispatch (and often a terminal write) for every tiny piece. The buffer
+    collects deltas and releases them when either limit is reached:
+
+    - `max_bytes`: accumulated text length (characters) reaches the limit.
+    - `flush_interval_ms`: time since the last flush exceeds the interval.
+
+    Limits are checked as deltas arrive. The first delta of a response
+    usually arrives after the interval has elapsed, so time-to-first-token
+    is unaffected. Call `poll()` for upstream events that carry no text
+    (e.g. tool-call deltas) so buffered text is not held back by them, and
+    `flush()` when the upstream iterator ends.
+    """
+
+    def __init__(self, max_bytes: int = 8192, flush_interval_ms: float = 25) -> None:
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval_ms / 1000
+        self._parts: List[str] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    def push(self, text: str) -> Optional[str]:
+        """
+        Add a delta. Returns the coalesced text if a limit was hit, else None.
+        """
+        self._parts.append(text)
+        self._size += len(text)
+        if (
+            self._size >= self.max_bytes
+            or time.monotonic() - self._last_flush > self.flush_interval
+        ):
+            return self.flush()
+        return None
+
+    def poll(self) -> Optional[str]:
+        """
+        Return the buffered text if the flush interval has elapsed, else None.
+        """
+        if self._parts and time.monotonic() - self._last_flush > self.flush_interval:
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[str]:
+        """
+        Return everything buffered so far (None if empty) and reset.
+        """
+        self._last_flush = time.monotonic()
+        if not self._parts:
+            return None
+
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        return text
@@ -1,6 +1,9 @@
-from .tool import Tool, tool
+from .tool import Tool, ToolResult, tool
+from .parallel_executor import ParallelToolExecutor
 
 __all__ = [
     "Tool",
+    "ToolResult",
+    "ParallelToolExecutor",
     "tool"
 ]
\ No newline at end of file
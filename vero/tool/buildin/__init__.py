@@ -1,2 +1,2 @@
-from .ddg_search import duckduckgo_search
-from .math_calculator import math_evaluate
\ No newline at end of file
+from .ddg_search import duckduckgo_search, duckduckgo_search_async
+from .math_calculator import math_evaluate
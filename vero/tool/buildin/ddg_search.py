@@ -1,19 +1,26 @@
+import asyncio
+
 from ddgs import DDGS
+from vero.core.llm_cache import MemoryBackend
 from vero.tool import tool
 
-@tool
-def duckduckgo_search(query: str, max_results: int = 3) -> str:
-    """
-    Perform a web search and return formatted results.
 
-    Args:
-        query (str): The search query string.
-        max_results (int, optional): Maximum number of search results to retrieve. Defaults to 3.
+# Recent results keyed by (query, max_results). Agents often repeat a query
+# (retries, reflection, multi-step plans); a short TTL keeps results fresh.
+_SEARCH_CACHE_TTL = 300
+_search_cache = MemoryBackend(maxsize=256)
 
-    Returns:
-        str: A formatted string containing titles, URLs and snippets of the search results,
-             or an error/fallback message if the search fails or yields no results.
+
+def _search(query: str, max_results: int) -> str:
+    """
+    Run the search (or serve it from the cache) and format the results.
+    Shared by the sync and async tools.
     """
+    cache_key = (query, max_results)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         # Use a context manager to ensure the DDGS session is properly closed
         with DDGS() as ddgs:
@@ -23,17 +30,51 @@ def duckduckgo_search(query: str, max_results: int = 3) -> str:
         if not results:
             return "No search results found."
 
-        output_lines = []
-        for r in results:
-            # r is a dict containing 'title', 'href', 'body'
-            title = r.get("title", "No title")
-            href = r.get("href", "")
-            body = r.get("body", "")
-            output_lines.append(f"Title: {title}\nLink: {href}\nSnippet: {body}\n")
+        # r is a dict containing 'title', 'href', 'body'
+        fmt = "Title: {}\nLink: {}\nSnippet: {}\n".format
+        output = "\n".join(
+            fmt(r.get("title", "No title"), r.get("href", ""), r.get("body", ""))
+            for r in results
+        )
 
-        # Join and return the output
-        return "\n".join(output_lines)
+        # Only real results are cached
+        _search_cache.set(cache_key, output, expire=_SEARCH_CACHE_TTL)
+        return output
 
     except Exception as e:
         # Catch all exceptions to prevent the agent from crashing
         return f"DuckDuckGo search failed: {e}"
+
+
+@tool
+def duckduckgo_search(query: str, max_results: int = 3) -> str:
+    """
+    Perform a web search and return formatted results.
+
+    Args:
+        query (str): The search query string.
+        max_results (int, optional): Maximum number of search results to retrieve. Defaults to 3.
+
+    Returns:
+        str: A formatted string containing titles, URLs and snippets of the search results,
+             or an error/fallback message if the search fails or yields no results.
+    """
+    return _search(query, max_results)
+
+
+@tool
+async def duckduckgo_search_async(query: str, max_results: int = 3) -> str:
+    """
+    Perform a web search and return formatted results, without blocking the
+    event loop. Several searches issued together run concurrently.
+
+    Args:
+        query (str): The search query string.
+        max_results (int, optional): Maximum number of search results to retrieve. Defaults to 3.
+
+    Returns:
+        str: A formatted string containing titles, URLs and snippets of the search results,
+             or an error/fallback message if the search fails or yields no results.
+    """
+    # DDGS is synchronous: run it on a worker thread
+    return await asyncio.to_thread(_search, query, max_results)
@@ -1,6 +1,62 @@
+import ast
 import math
+from functools import lru_cache
+from types import CodeType, MappingProxyType
+
 from vero.tool import tool
 
+
+# Names an expression may reference. An explicit list rather than all of
+# `math`: functions such as comb/factorial/prod can be made to run for a
+# very long time with small inputs. Read-only: it is shared by every call.
+_ALLOWED_NAMES = MappingProxyType({
+    name: getattr(math, name)
+    for name in (
+        "sqrt", "sin", "cos", "tan", "asin", "acos", "atan", "atan2",
+        "log", "log2", "log10", "exp", "pow", "ceil", "floor", "fabs",
+        "pi", "e", "tau", "inf", "nan",
+    )
+})
+_ALLOWED_SET = frozenset(_ALLOWED_NAMES)
+
+
+class _DisallowedExpressionError(ValueError):
+    """
+    Raised when an expression references a name outside `_ALLOWED_NAMES` or
+    assigns to a name.
+    """
+
+
+@lru_cache(maxsize=512)
+def _compile_expr(expr: str) -> CodeType:
+    """
+    Parse `expr`, check the names it uses and compile it. Cached per
+    expression string, so re-evaluating the same expression skips parsing
+    entirely; rejected input never reaches the compiler.
+    """
+    tree = ast.parse(expr, mode="eval")
+
+    # inspect names and attributes used in expression; disallow names not
+    # in _ALLOWED_NAMES, and any assignment (walrus, comprehension targets)
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if not isinstance(node.ctx, ast.Load):
+                raise _DisallowedExpressionError(
+                    f"assignment to '{node.id}' is not allowed."
+                )
+            names.append(node.id)
+        elif isinstance(node, ast.Attribute):
+            names.append(node.attr)
+
+    if not _ALLOWED_SET.issuperset(names):
+        name = next(name for name in names if name not in _ALLOWED_SET)
+        raise _DisallowedExpressionError(f"use of '{name}' is not allowed.")
+
+    code = compile(tree, "<string>", "eval")
+    return code
+
+
 @tool
 def math_evaluate(expr: str) -> str:
     """
@@ -9,29 +65,22 @@ def math_evaluate(expr: str) -> str:
     Args:
         expr (str): A mathematical expression as a string. 
             It may include numbers, arithmetic operators (+, -, *, /, **, %, parentheses),
-            and math module functions/constants (e.g. sqrt, sin, cos, pi, etc.).
+            and common math functions/constants (sqrt, sin, cos, tan, asin, acos,
+            atan, atan2, log, log2, log10, exp, pow, ceil, floor, fabs, pi, e,
+            tau, inf, nan).
 
     Returns:
         str: The result of the evaluation, or an error message if evaluation fails or input is invalid.
     """
-    # define allowed names: from math module
-    allowed_names = {
-        k: getattr(math, k) for k in dir(math) if not k.startswith("__")
-    }
-
     try:
-        # compile expression to code object
-        code = compile(expr, "<string>", "eval")
-
-        # inspect names used in expression; disallow names not in allowed_names
-        for name in code.co_names:
-            if name not in allowed_names:
-                return f"Error: use of '{name}' is not allowed."
+        code = _compile_expr(expr)
 
         # evaluate expression with restricted globals and allowed math names
-        result = eval(code, {"__builtins__": {}}, allowed_names)
+        result = eval(code, {"__builtins__": {}}, _ALLOWED_NAMES)
 
         return str(result)
+    except _DisallowedExpressionError as e:
+        return f"Error: {e}"
     except Exception as e:
         # catch exceptions (syntax error, math domain error, etc.)
         return f"Evaluation error: {e}"
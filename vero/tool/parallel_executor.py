@@ -0,0 +1,190 @@
+import time
+import asyncio
+import inspect
+import functools
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from vero.config import settings
+from vero.core.debug import log_debug
+from vero.core.exceptions import ToolCallError, ToolNotFoundError
+
+from .tool import Tool
+
+
+class ParallelToolExecutor:
+    """
+    Run a batch of tool calls concurrently on a shared thread pool.
+
+    Tools are mostly I/O bound (web search, HTTP APIs), so running the calls of
+    one turn on threads makes the batch take about as long as its slowest call
+    instead of the sum of all of them.
+
+    Each call is isolated: a missing tool, invalid parameters or an exception
+    raised by the tool is returned as a ToolError instance in that call's
+    slot, so one failure does not affect the rest of the batch.
+
+    The worker threads are released by `close()`, or on leaving a `with`
+    block.
+
+    Attributes:
+        max_workers (int): Maximum number of tool calls running at once.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self.max_workers = max_workers or settings.tool_concurrency
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="vero-tool"
+        )
+
+    def execute(
+        self,
+        tool_by_names: Dict[str, Tool],
+        calls: Sequence[Tuple[str, Any]],
+    ) -> List[Any]:
+        """
+        Execute `(tool_name, params)` calls and return their results.
+
+        Args:
+            tool_by_names: Name → Tool lookup of the calling agent.
+            calls: Tool calls in the order requested by the model.
+
+        Returns:
+            One entry per call, in the same order as `calls`: the tool output,
+            or a ToolNotFoundError / ToolCallError describing the failure.
+        """
+        results: List[Any] = [None] * len(calls)
+        pending = self._resolve(tool_by_names, calls, results)
+
+        # A single call runs inline; there is nothing to overlap it with
+        if len(pending) == 1:
+            idx, tool, params = pending[0]
+            try:
+                results[idx] = self._timed_call(tool, params)
+            except Exception as e:
+                results[idx] = ToolCallError(f"Tool execution failed: {e}")
+            return results
+
+        futures = [
+            (idx, self._pool.submit(self._timed_call, tool, params))
+            for idx, tool, params in pending
+        ]
+        wait([future for _, future in futures])
+
+        for idx, future in futures:
+            error = future.exception()
+            if error is None:
+                results[idx] = future.result()
+            else:
+                results[idx] = ToolCallError(f"Tool execution failed: {error}")
+
+        return results
+
+    async def aexecute(
+        self,
+        tool_by_names: Dict[str, Tool],
+        calls: Sequence[Tuple[str, Any]],
+    ) -> List[Any]:
+        """
+        Async counterpart of `execute`.
+
+        `async def` tools are awaited together on the running event loop;
+        synchronous tools run on the thread pool so they never block it.
+
+        Returns:
+            Same as `execute`: one entry per call, in the order of `calls`.
+        """
+        results: List[Any] = [None] * len(calls)
+        pending = self._resolve(tool_by_names, calls, results)
+
+        outcomes = await asyncio.gather(
+            *(self._atimed_call(tool, params) for _, tool, params in pending),
+            return_exceptions=True,
+        )
+        for (idx, _, _), outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                results[idx] = ToolCallError(f"Tool execution failed: {outcome}")
+            else:
+                results[idx] = outcome
+
+        return results
+
+    def close(self) -> None:
+        """Release the worker threads (running calls are allowed to finish)."""
+        self._pool.shutdown(wait=False)
+
+    def __enter__(self) -> "ParallelToolExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _resolve(
+        tool_by_names: Dict[str, Tool],
+        calls: Sequence[Tuple[str, Any]],
+        results: List[Any],
+    ) -> List[Tuple[int, Tool, Dict[str, Any]]]:
+        """
+        Look up the tool of every call. Calls that cannot run get their error
+        written into `results`; the rest are returned as (index, tool, params).
+        """
+        pending = []
+        for idx, (tool_name, params) in enumerate(calls):
+            tool = tool_by_names.get(tool_name)
+            if tool is None:
+                results[idx] = ToolNotFoundError(f"Unknown tool: {tool_name}")
+            elif not isinstance(params, dict):
+                results[idx] = ToolCallError(
+                    "Tool parameters must be provided as an object/dict."
+                )
+            else:
+                pending.append((idx, tool, params))
+        return pending
+
+    @staticmethod
+    def _timed_call(tool: Tool, params: Dict[str, Any]) -> Any:
+        """
+        Invoke a tool and log its wall-clock cost.
+        """
+        start = time.perf_counter()
+        try:
+            result = tool.invoke(**params)
+            if inspect.iscoroutine(result):
+                # `async def` tool called from a worker thread
+                result = asyncio.run(result)
+        except Exception as e:
+            log_debug(f"💥 Tool `{tool.name}` execution failed: {e}")
+            raise
+
+        ParallelToolExecutor._log_result(tool, result, start)
+        return result
+
+    async def _atimed_call(self, tool: Tool, params: Dict[str, Any]) -> Any:
+        """
+        Await an `async def` tool on the event loop, or run a synchronous one
+        on the thread pool.
+        """
+        if not tool.is_async:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._pool, functools.partial(self._timed_call, tool, params)
+            )
+
+        start = time.perf_counter()
+        try:
+            result = await tool.invoke(**params)
+        except Exception as e:
+            log_debug(f"💥 Tool `{tool.name}` execution failed: {e}")
+            raise
+
+        self._log_result(tool, result, start)
+        return result
+
+    @staticmethod
+    def _log_result(tool: Tool, result: Any, start: float) -> None:
+        """Log a tool result with the wall-clock cost since `start`."""
+        log_debug(
+            f"📦 Tool `{tool.name}` result: {result} | "
+            f"⏱️ Cost: {time.perf_counter() - start:.1f}s"
+        )
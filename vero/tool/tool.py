@@ -1,5 +1,41 @@
+import sys
 import inspect
-from typing import Any, Dict, List, Union, get_origin, get_args
+from dataclasses import dataclass
+from functools import lru_cache
+from types import UnionType
+from typing import Any, Dict, List, Optional, Tuple, Union, get_origin, get_args
+
+
+# Mapping from Python types to JSON Schema types
+_PYTHON_TO_JSON = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    dict: "object",
+    list: "array",
+}
+
+
+@dataclass
+class ToolResult:
+    """
+    Structured tool output.
+
+    A tool may return a `ToolResult` instead of a plain value. When `final`
+    is True the agent treats `content` as the answer to the user's query and
+    finishes the run without another LLM round-trip.
+
+    Attributes:
+        content (str): The tool output.
+        final (bool): Whether `content` is already the final answer.
+    """
+
+    content: str
+    final: bool = False
+
+    def __str__(self) -> str:
+        return str(self.content)
 
 
 class Tool:
@@ -14,20 +50,15 @@ class Tool:
         name (str): The tool's name (derived from the wrapped function name).
         description (str): Human-readable explanation of what the tool does.
         func (callable): The underlying Python function.
+        invoke (callable): Same as `func`; preferred over `tool(...)` in hot loops.
         arguments (list): List of (param_name, param_type, default) tuples.
         outputs (str): The return type annotation as a string.
         signature (inspect.Signature): Cached function signature.
+        is_async (bool): Whether the wrapped function is `async def`.
     """
 
     # Mapping from Python types to JSON Schema types
-    PYTHON_TO_JSON = {
-        str: "string",
-        int: "integer",
-        float: "number",
-        bool: "boolean",
-        dict: "object",
-        list: "array",
-    }
+    PYTHON_TO_JSON = _PYTHON_TO_JSON
 
     def __init__(
         self,
@@ -36,15 +67,29 @@ class Tool:
         func: callable,
         arguments: list,
         outputs: str,
+        signature: Optional[inspect.Signature] = None,
     ):
         self.name = name
         self.description = description
         self.func = func
+        # Direct reference for hot loops: calling the Tool itself goes through
+        # __call__, one extra Python frame per invocation
+        self.invoke = func
         self.arguments = arguments
         self.outputs = outputs
 
-        # Cached inspect signature (used for schema generation)
-        self.signature = inspect.signature(func)
+        # Checked once: agents use it to decide whether to await the tool
+        self.is_async = inspect.iscoroutinefunction(func)
+
+        # Cached inspect signature (used for schema generation); the `tool`
+        # decorator passes the one it already computed
+        self.signature = signature if signature is not None else _cached_signature(func)
+
+        # The wrapped function never changes, so the prompt line and the
+        # schema are built once here
+        args_str = ", ".join(f"{arg}: {typ}" for (arg, typ, *_rest) in arguments)
+        self._to_string = f"{name}({args_str}) - {description}"
+        self._openai_schema = self._build_openai_schema()
 
     def __call__(self, *args, **kwargs):
         """
@@ -55,12 +100,24 @@ class Tool:
     def __repr__(self):
         return f"<Tool {self.name}>"
 
+    def to_string(self) -> str:
+        """
+        Return the one-line description used in text prompts, e.g.
+        `search_web(query: str) - Search the internet`.
+
+        Built once when the Tool is created.
+        """
+        return self._to_string
+
     # ------------------------------------------------------------------
     # OpenAI / Qwen Function Calling Schema
     # ------------------------------------------------------------------
     def to_openai_schema(self) -> dict:
         """
-        Convert this Tool into an OpenAI-compatible function calling schema.
+        Return this Tool as an OpenAI-compatible function calling schema.
+
+        The schema is computed once when the Tool is created; callers must
+        treat the returned dict as read-only.
 
         Returns:
             dict: Schema in the format expected by OpenAI / Qwen:
@@ -73,6 +130,12 @@ class Tool:
                   }
                 }
         """
+        return self._openai_schema
+
+    def _build_openai_schema(self) -> dict:
+        """
+        Introspect the wrapped function's signature into a function calling schema.
+        """
         properties: Dict[str, Any] = {}
         required: List[str] = []
 
@@ -87,8 +150,8 @@ class Tool:
 
             schema, is_required = self._annotation_to_schema(annotation, default)
 
-            # Ensure every parameter has a description
-            schema["description"] = name
+            # Ensure every parameter has a description (copy: fragments are shared)
+            schema = {**schema, "description": name}
             properties[name] = schema
 
             if is_required:
@@ -121,37 +184,92 @@ class Tool:
         Returns:
             (schema_dict, is_required)
         """
-        origin = get_origin(annotation)
-        args = get_args(annotation)
-
-        # Optional[T] → not required
-        if origin is Union and type(None) in args:
-            non_none = [a for a in args if a is not type(None)]
-            if len(non_none) == 1:
-                sch, _ = self._annotation_to_schema(non_none[0], None)
-                return {"anyOf": [sch, {"type": "null"}]}, False
-
-        # List[T]
-        if origin in (list, List):
-            item = args[0] if args else Any
-            item_schema, _ = self._annotation_to_schema(item, None)
-            return {"type": "array", "items": item_schema}, default is None
-
-        # Dict[str, T]
-        if origin in (dict, Dict):
-            value_type = args[1] if len(args) == 2 else Any
-            value_schema, _ = self._annotation_to_schema(value_type, None)
-            return {
-                "type": "object",
-                "additionalProperties": value_schema,
-            }, default is None
-
-        # Primitive types
-        if annotation in self.PYTHON_TO_JSON:
-            return {"type": self.PYTHON_TO_JSON[annotation]}, default is None
-
-        # Fallback to string
-        return {"type": "string"}, default is None
+        try:
+            return _annotation_schema(annotation, default is None)
+        except TypeError:
+            # Unhashable annotation: skip the cache
+            return _annotation_schema.__wrapped__(annotation, default is None)
+
+
+def _union_schema(args: Tuple, default_is_none: bool) -> Tuple[dict, bool]:
+    # Optional[T] → not required
+    if type(None) in args:
+        non_none = [a for a in args if a is not type(None)]
+        if len(non_none) == 1:
+            sch, _ = _annotation_schema(non_none[0], True)
+            return {"anyOf": [sch, {"type": "null"}]}, False
+
+    return {"type": "string"}, default_is_none
+
+
+def _list_schema(args: Tuple, default_is_none: bool) -> Tuple[dict, bool]:
+    # List[T]
+    item = args[0] if args else Any
+    item_schema, _ = _annotation_schema(item, True)
+    return {"type": "array", "items": item_schema}, default_is_none
+
+
+def _dict_schema(args: Tuple, default_is_none: bool) -> Tuple[dict, bool]:
+    # Dict[str, T]
+    value_type = args[1] if len(args) == 2 else Any
+    value_schema, _ = _annotation_schema(value_type, True)
+    return {
+        "type": "object",
+        "additionalProperties": value_schema,
+    }, default_is_none
+
+
+# get_origin() → schema builder for generic annotations
+_ORIGIN_DISPATCH = {
+    Union: _union_schema,
+    UnionType: _union_schema,
+    list: _list_schema,
+    dict: _dict_schema,
+}
+
+
+@lru_cache(maxsize=None)
+def _annotation_schema(annotation: Any, default_is_none: bool) -> Tuple[dict, bool]:
+    """
+    Memoized annotation → JSON Schema conversion.
+
+    Tools share many annotations (`str`, `int`, `Optional[Dict[str, str]]`, ...),
+    so the `typing` introspection is done once per distinct annotation. The
+    returned fragments are shared and must not be mutated.
+    """
+    # Primitive types: a single dict lookup, no typing introspection
+    json_type = _PYTHON_TO_JSON.get(annotation)
+    if json_type is not None:
+        return {"type": json_type}, default_is_none
+
+    handler = _ORIGIN_DISPATCH.get(get_origin(annotation))
+    if handler is not None:
+        return handler(get_args(annotation), default_is_none)
+
+    # Fallback to string
+    return {"type": "string"}, default_is_none
+
+
+@lru_cache(maxsize=None)
+def _signature(func: Any) -> inspect.Signature:
+    return inspect.signature(func)
+
+
+def _cached_signature(func: Any) -> inspect.Signature:
+    """
+    Return the signature of `func`, computing it at most once per callable.
+
+    A `__signature__` already set on the callable is used as-is, skipping
+    inspection entirely.
+    """
+    signature = getattr(func, "__signature__", None)
+    if isinstance(signature, inspect.Signature):
+        return signature
+    try:
+        return _signature(func)
+    except TypeError:
+        # Unhashable callable: skip the cache
+        return inspect.signature(func)
 
 
 # ----------------------------------------------------------------------
@@ -175,28 +293,21 @@ def tool(func):
     Returns:
         Tool: A fully constructed Tool instance.
     """
-    signature = inspect.signature(func)
+    signature = _cached_signature(func)
     arguments = []
 
     for param in signature.parameters.values():
         annotation = param.annotation
-        type_str = (
-            annotation.__name__
-            if hasattr(annotation, "__name__")
-            else str(annotation)
-        )
+        type_str = getattr(annotation, "__name__", None) or str(annotation)
         default = None if param.default is inspect._empty else param.default
-        arguments.append((param.name, type_str, default))
+        # Interned: the names double as schema property keys
+        arguments.append((sys.intern(param.name), sys.intern(type_str), default))
 
     return_annotation = signature.return_annotation
     outputs = (
         "None"
         if return_annotation is inspect._empty
-        else (
-            return_annotation.__name__
-            if hasattr(return_annotation, "__name__")
-            else str(return_annotation)
-        )
+        else getattr(return_annotation, "__name__", None) or str(return_annotation)
     )
 
     description = inspect.getdoc(func) or "No description provided."
@@ -208,4 +319,5 @@ def tool(func):
         func=func,
         arguments=arguments,
         outputs=outputs,
+        signature=signature,
     )